@@ -1,39 +1,50 @@
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
-def remove_pycache_dirs(root_dir):
-    removed = 0
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        if "__pycache__" in dirnames:
-            pycache_path = os.path.join(dirpath, "__pycache__")
+def _find_python_caches(root_dir):
+    """Yield (is_dir, path) for __pycache__ directories and stray .pyc/.pyo files in one scandir pass"""
+    pending = [root_dir]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue  # Unreadable directory - skipped, as os.walk would
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name == "__pycache__":
+                        yield True, entry.path
+                    else:
+                        pending.append(entry.path)
+                elif entry.name.endswith(('.pyc', '.pyo')):
+                    yield False, entry.path
+
+def remove_python_caches(root_dir, max_workers=8):
+    """Remove __pycache__ directories and stray .pyc/.pyo files, deleting while the scan continues"""
+    removed_dirs = 0
+    removed_files = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(shutil.rmtree if is_dir else os.remove, path): (is_dir, path)
+                   for is_dir, path in _find_python_caches(root_dir)}
+        for future in as_completed(futures):
+            is_dir, path = futures[future]
             try:
-                shutil.rmtree(pycache_path)
-                print(f"Removed: {pycache_path}")
-                removed += 1
+                future.result()
+                print(f"Removed: {path}")
+                if is_dir:
+                    removed_dirs += 1
+                else:
+                    removed_files += 1
             except Exception as e:
-                print(f"Failed to remove {pycache_path}: {e}")
-    return removed
-
-def remove_pyc_pyo_files(root_dir):
-    removed = 0
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        for filename in filenames:
-            if filename.endswith('.pyc') or filename.endswith('.pyo'):
-                file_path = os.path.join(dirpath, filename)
-                try:
-                    os.remove(file_path)
-                    print(f"Removed: {file_path}")
-                    removed += 1
-                except Exception as e:
-                    print(f"Failed to remove {file_path}: {e}")
-    return removed
+                print(f"Failed to remove {path}: {e}")
+    return removed_dirs, removed_files
 
 def main():
     root = os.path.dirname(os.path.abspath(__file__))
     print(f"Cleaning Python cache files in: {root}")
-    d = remove_pycache_dirs(root)
-    f = remove_pyc_pyo_files(root)
+    d, f = remove_python_caches(root)
     print(f"\n✅ Removed {d} __pycache__ directories and {f} .pyc/.pyo files.")
 
 if __name__ == "__main__":
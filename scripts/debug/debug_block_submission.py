@@ -11,15 +11,18 @@ import json
 # Add src and parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-from src.crypto.ecdsa_crypto import double_sha256
+from src.crypto.ecdsa_crypto import double_sha256, double_sha256_prefixed
 
 def debug_block_submission():
     print("🔍 DEBUG: Block Submission Process")
     print("=" * 50)
     
+    # One keep-alive connection for the template, submission and status calls
+    session = requests.Session()
+    
     # Step 1: Get block template
     print("📋 Step 1: Getting block template...")
-    resp = requests.post('http://localhost:5000/mine_block',
+    resp = session.post('http://localhost:5000/mine_block',
                         json={'miner_address': 'debug_miner'},
                         headers={'Content-Type': 'application/json'})
     
@@ -39,24 +42,29 @@ def debug_block_submission():
     required_prefix = "0" * target_difficulty
     nonce = 0
     
+    # Same preimage as the Block class hash: sorted-key JSON of the header fields
+    block_data = {
+        'index': block_template['index'],
+        'previous_hash': block_template['previous_hash'],
+        'merkle_root': block_template['merkle_root'],
+        'timestamp': block_template['timestamp'],
+        'nonce': nonce,
+        'target_difficulty': target_difficulty
+    }
+    
+    # Serialize the header once around a nonce placeholder, so each attempt only formats
+    # the nonce and resumes from the SHA-256 state already fed the fixed prefix
+    template = json.dumps(dict(block_data, nonce="__NONCE__"), sort_keys=True)
+    prefix, suffix = template.split('"__NONCE__"')
+    hash_with_nonce = double_sha256_prefixed(prefix)
+    
     while nonce < 1000:  # Safety limit
-        # Update block template with current nonce
-        test_block = block_template.copy()
-        test_block['nonce'] = nonce
-        
-        # Calculate hash using Block class method
-        block_data = {
-            'index': test_block['index'],
-            'previous_hash': test_block['previous_hash'],
-            'merkle_root': test_block['merkle_root'],
-            'timestamp': test_block['timestamp'],
-            'nonce': nonce,
-            'target_difficulty': target_difficulty
-        }
-        
-        calculated_hash = double_sha256(json.dumps(block_data, sort_keys=True))
+        calculated_hash = hash_with_nonce(f"{nonce}{suffix}")
         
         if calculated_hash.startswith(required_prefix):
+            block_data['nonce'] = nonce
+            # Confirm against the node's own hash of the full header
+            assert calculated_hash == double_sha256(json.dumps(block_data, sort_keys=True))
             print(f"✅ Valid hash found! Nonce: {nonce}, Hash: {calculated_hash[:32]}...")
             break
         nonce += 1
@@ -82,7 +90,7 @@ def debug_block_submission():
     # Step 4: Submit block
     print("📋 Step 4: Submitting block...")
     
-    submit_resp = requests.post('http://localhost:5000/submit_block',
+    submit_resp = session.post('http://localhost:5000/submit_block',
                                json={'block': final_block},
                                headers={
                                    'Content-Type': 'application/json',
@@ -96,7 +104,7 @@ def debug_block_submission():
         print("✅ Block submission successful!")
         
         # Check blockchain length
-        status_resp = requests.get('http://localhost:5000/status')
+        status_resp = session.get('http://localhost:5000/status')
         if status_resp.status_code == 200:
             new_length = status_resp.json()['blockchain_length']
             print(f"📊 New blockchain length: {new_length}")
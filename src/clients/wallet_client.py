@@ -278,6 +278,8 @@ def main():
     
     if args.command == 'create':
         wallet = WalletClient(args.wallet, args.node)
+        # Machine-readable line so scripted callers get the address without re-reading the wallet file
+        print(f"ADDRESS={wallet.address}")
         
     elif args.command == 'balance':
         wallet = WalletClient(args.wallet, args.node)
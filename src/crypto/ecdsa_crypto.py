@@ -124,6 +124,24 @@ def double_sha256(data):
         data = data.encode('utf-8')
     return hashlib.sha256(hashlib.sha256(data).digest()).hexdigest()
 
+def double_sha256_prefixed(prefix):
+    """
+    double_sha256 for many messages sharing one prefix, e.g. a header around a nonce.
+    Returns f(tail) == double_sha256(prefix + tail); the prefix is fed to SHA-256 once.
+    """
+    if isinstance(prefix, str):
+        prefix = prefix.encode('utf-8')
+    prefix_state = hashlib.sha256(prefix)
+    
+    def hash_with_tail(tail):
+        if isinstance(tail, str):
+            tail = tail.encode('utf-8')
+        inner = prefix_state.copy()
+        inner.update(tail)
+        return hashlib.sha256(inner.digest()).hexdigest()
+    
+    return hash_with_tail
+
 def validate_address(address):
     """Validate Bitcoin-style address"""
     try:
@@ -6,23 +6,154 @@ Automatically discovers and monitors all active nodes in the network
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import sys
 import threading
 import concurrent.futures
+import functools
+import io
+import statistics
+import errno
+import selectors
+import socket
+from array import array
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple
-from collections import defaultdict
+from collections import Counter, OrderedDict, defaultdict, deque
+
+# Optional C-accelerated JSON decoder for large chain payloads
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Shared default for read-only .get() lookups, so a missing key allocates nothing
+_EMPTY: tuple = ()
+
+# Required leading-zero prefix per difficulty, one shared string per hex digit of a hash
+_ZERO_PREFIX = tuple("0" * i for i in range(65))
+
+@functools.lru_cache(maxsize=4096)
+def _format_block_time(timestamp: int) -> str:
+    """HH:MM:SS for a block timestamp, formatted once per second value"""
+    return datetime.fromtimestamp(timestamp).strftime("%H:%M:%S")
+
+def _probe_open_ports(host: str, ports: List[int], timeout: float = 0.25) -> List[int]:
+    """
+    Non-blocking TCP connect to every port at once; return the ports that accepted.
+    Every address the host resolves to is tried, as an HTTP client would (e.g. ::1 and 127.0.0.1).
+    """
+    try:
+        addresses = {(family, sockaddr) for family, _, _, _, sockaddr
+                     in socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)}
+    except OSError:
+        return []
+    
+    selector = selectors.DefaultSelector()
+    open_ports = set()
+    try:
+        for port in ports:
+            for family, sockaddr in addresses:
+                sock = socket.socket(family, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                err = sock.connect_ex((sockaddr[0], port) + tuple(sockaddr[2:]))
+                if err == 0:
+                    open_ports.add(port)
+                    sock.close()
+                elif err in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN):
+                    selector.register(sock, selectors.EVENT_WRITE, port)
+                else:
+                    sock.close()  # Refused outright - nothing listening
+        
+        deadline = time.monotonic() + timeout
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in selector.select(remaining):
+                if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    open_ports.add(key.data)
+                selector.unregister(key.fileobj)
+                key.fileobj.close()
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+    return sorted(open_ports)
+
+def _to_soa(chain: List[Dict]) -> Dict:
+    """Column view of a chain: flat hash lists plus packed index/difficulty arrays"""
+    return {
+        'hashes': [block['hash'] for block in chain],
+        'prev_hashes': [block['previous_hash'] for block in chain],
+        'indices': array('q', [block['index'] for block in chain]),
+        'difficulties': array('B', [block['target_difficulty'] for block in chain])
+    }
 
 class NetworkBlockchainMonitor:
     def __init__(self, discovery_start_port: int = 5000, discovery_end_port: int = 5010):
         self.discovery_start_port = discovery_start_port
         self.discovery_end_port = discovery_end_port
+        self._discovery_ports = list(range(discovery_start_port, discovery_end_port))
+        self.discovery_timeout = 1.0  # Whole discovery budget: port probe plus /status checks
+        self.discovery_host = "localhost"  # Probed and used in peer URLs, so both resolve alike
+        # port -> (peer URL, status URL), formatted once rather than on every rediscovery
+        self._candidate_urls = {port: (f"http://{self.discovery_host}:{port}",
+                                       f"http://{self.discovery_host}:{port}/status")
+                                for port in self._discovery_ports}
         self.active_peers: Set[str] = set()
         self.peer_data: Dict[str, Dict] = {}
-        self.peer_lock = threading.RLock()
+        self.peer_lock = threading.Lock()  # Guards reference swaps only - never held across I/O
         self.peer_last_seen: Dict[str, int] = {}  # Track last seen length per peer
+        self._peer_label: Dict[str, str] = {}  # peer_url -> "Node-<port>"
+        
+        # Shared HTTP session - pooled keep-alive connections reused across polls
+        self.session = requests.Session()
+        self.session.headers['Connection'] = 'keep-alive'
+        # Size the pool to the discovery range so every peer keeps its own socket
+        pool_size = max(16, discovery_end_port - discovery_start_port)
+        # No transport retries - a hung peer must cost one timeout, not three, inside the poll budget
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Long-lived worker pool for discovery and per-tick fetches - threads are reused across ticks
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(32, pool_size),
+                                                           thread_name_prefix="chaincore-io")
+        
+        # Short-lived response cache: {url: (expires_at, payload)}, least recently used first
+        # Dedupes repeated fetches within a tick and rides out transient outages
+        self._response_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self.response_cache_size = 256  # Entry cap, so payload memory stays bounded between prunes
+        self._cache_lock = threading.Lock()  # Workers store concurrently; guards LRU reordering
+        self._etags: Dict[str, str] = {}  # Validators for conditional GETs, keyed by URL
+        self._not_found: Set[str] = set()  # URLs the peer rejected (400/404) on the last attempt
+        self._supports_snapshot: Dict[str, bool] = {}  # Per-peer /snapshot feature detection
+        self._peer_chains: Dict[str, List[Dict]] = {}  # Full chain per peer, extended by ?since deltas
+        self._peer_soa: Dict[str, Dict] = {}  # Column view of each held chain, see _to_soa
+        self._peer_tips: Dict[str, Tuple[int, str]] = {}  # (length, tip hash) seen on the last tick
+        self._peer_chain_lengths: Dict[str, int] = {}  # Chain length per peer from the last tick
+        self._last_consensus: Optional[Dict] = None
+        self._block_index: Dict[str, List[Tuple[str, int]]] = {}  # hash -> (peer, index) for peers holding it
+        self._block_index_source: Optional[Dict] = None
+        self._block_meta: Dict[str, Tuple[str, Optional[str], Optional[float]]] = {}  # Attribution per block hash
+        self._mining_cache: OrderedDict = OrderedDict()  # tip hash -> (chain length, miner_stats)
+        self.mining_cache_size = 8
+        self._status_analysis: Optional[Tuple[Dict, Dict]] = None  # (statuses analyzed, result)
+        self.cache_ttl = {'status': 2.0, 'blockchain': 2.0}
+        self.stale_grace = 30.0  # Seconds an expired entry may still serve as fallback
+        
+        # Incremental ledger state - only blocks past last_verified_index are re-checked
+        self.miner_stats: Dict[str, Dict] = {}
+        self.last_verified_index = -1
+        self._last_verified_hash: Optional[str] = None
+        self._issues: List[Dict] = []
+        
+        # Timestamps of the most recent ledger blocks - drive the adaptive poll interval
+        self._block_arrival_times: deque = deque(maxlen=20)
         
         # Clear any preserved data on initialization
         self._clear_all_data()
@@ -38,9 +169,26 @@ class NetworkBlockchainMonitor:
     def _clear_all_data(self):
         """Clear all preserved blockchain data and reset state"""
         with self.peer_lock:
-            self.active_peers.clear()
-            self.peer_data.clear()
+            # Swap rather than clear so readers holding the old references never see them mutate
+            self.active_peers = set()
+            self.peer_data = {}
             self.peer_last_seen.clear()
+            self._response_cache.clear()
+            self._etags.clear()
+            self._not_found.clear()
+            self._supports_snapshot.clear()
+            self._peer_chains.clear()
+            self._peer_soa.clear()
+            self._peer_tips = {}
+            self._peer_chain_lengths = {}
+            self._last_consensus = None
+            self._block_index = {}
+            self._block_index_source = None
+            self._block_meta.clear()
+            self._mining_cache.clear()
+            self._status_analysis = None
+            self._block_arrival_times.clear()
+            self._reset_incremental_state()
             self.network_stats = {
                 'total_peers': 0,
                 'longest_chain_length': 0,
@@ -48,6 +196,51 @@ class NetworkBlockchainMonitor:
                 'consensus_status': 'unknown'
             }
         print("Cleared all preserved blockchain data")
+    
+    def _node_label(self, peer_url: str) -> str:
+        """'Node-<port>' display label for a peer URL, parsed once per peer"""
+        label = self._peer_label.get(peer_url)
+        if label is None:
+            port = str(peer_url).rsplit(':', 1)[-1] if ':' in str(peer_url) else "unknown"
+            label = self._peer_label[peer_url] = f"Node-{port}"
+        return label
+    
+    def close(self):
+        """Release pooled HTTP connections and worker threads"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+    
+    def _reset_incremental_state(self):
+        """Forget everything folded into the incremental verifier and miner stats"""
+        self.miner_stats = {}
+        self.last_verified_index = -1
+        self._last_verified_hash = None
+        self._issues = []
+    
+    def _record_block_arrival(self, blocks: List[Dict]):
+        """Note the timestamps of newly seen blocks, one entry per block, for the poll interval estimate"""
+        self._block_arrival_times.extend(block['timestamp'] for block in blocks if 'timestamp' in block)
+    
+    def _next_poll_interval(self, interval: float) -> float:
+        """
+        Sleep for half the mean block time, taken from block timestamps so it does not
+        depend on the poll rate. The user's interval is the upper bound; the floor is 1s.
+        """
+        arrivals = list(self._block_arrival_times)
+        # Out-of-order timestamps (clock skew, reorgs) say nothing about the block rate
+        diffs = [b - a for a, b in zip(arrivals, arrivals[1:]) if b > a]
+        if not diffs:
+            return interval
+        return max(min(1.0, interval), min(interval, statistics.fmean(diffs) / 2))
+    
+    def _incremental_start(self, blocks: List[Dict]) -> int:
+        """Return the first block index not yet folded into incremental state"""
+        tip = self.last_verified_index
+        if tip >= 0 and (tip >= len(blocks) or blocks[tip]['hash'] != self._last_verified_hash):
+            # Ledger was shortened or replaced (reorg) - start over
+            self._reset_incremental_state()
+            return 0
+        return tip + 1
         
     def discover_active_peers(self) -> Set[str]:
         """Automatically discover all active peers in the network"""
@@ -55,43 +248,43 @@ class NetworkBlockchainMonitor:
         
         print(f"Discovering active peers on ports {self.discovery_start_port}-{self.discovery_end_port}...")
         
+        # One deadline for the probe and the /status checks together
+        deadline = time.monotonic() + self.discovery_timeout
+        
         def check_peer(port: int) -> Optional[str]:
             """Check if a peer is active on the given port"""
-            peer_url = f"http://localhost:{port}"
+            peer_url, status_url = self._candidate_urls[port]
             try:
-                response = requests.get(f"{peer_url}/status", timeout=1)  # Faster timeout
+                # Time out with the budget, so an abandoned check frees its worker by the deadline
+                response = self.session.get(status_url, timeout=max(0.05, deadline - time.monotonic()))
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _json_loads(response.content)
                     # Verify it's actually a ChainCore node
                     if 'blockchain_length' in data and 'node_id' in data:
                         return peer_url
-            except requests.RequestException:
+            except (requests.RequestException, ValueError):
                 pass
             return None
         
-        # Use thread pool for concurrent peer discovery with optimized settings
-        port_range = list(range(self.discovery_start_port, self.discovery_end_port))
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(check_peer, port) for port in port_range]
-            
-            # Use as_completed with reasonable timeout
-            try:
-                for future in concurrent.futures.as_completed(futures, timeout=15):
-                    try:
-                        peer_url = future.result(timeout=0.5)  # Quick individual timeout
-                        if peer_url:
-                            discovered_peers.add(peer_url)
-                            print(f"   ✅ Found active peer: {peer_url}")
-                    except concurrent.futures.TimeoutError:
-                        pass  # Skip slow responses
-                    except Exception:
-                        pass  # Skip errors
-            except concurrent.futures.TimeoutError:
-                print(f"   ⏰ Discovery completed - found {len(discovered_peers)} peers")
-                # Cancel any remaining futures
-                for future in futures:
-                    if not future.done():
-                        future.cancel()
+        # A closed port refuses the TCP handshake immediately, so only ports that accept
+        # a connection get the HTTP /status check - all in a single wave
+        open_ports = _probe_open_ports(self.discovery_host, self._discovery_ports,
+                                       timeout=min(0.25, self.discovery_timeout))
+        futures = [self._pool.submit(check_peer, port) for port in open_ports]
+        done, pending = concurrent.futures.wait(futures, timeout=max(0, deadline - time.monotonic()))
+        
+        # Don't wait on stragglers; their sockets time out on their own
+        for future in pending:
+            future.cancel()
+        
+        for future in futures:
+            peer_url = future.result() if future in done and not future.exception() else None
+            if peer_url:
+                discovered_peers.add(peer_url)
+                self._node_label(peer_url)
+                print(f"   ✅ Found active peer: {peer_url}")
+        if pending:
+            print(f"   ⏰ Discovery completed - found {len(discovered_peers)} peers")
         
         with self.peer_lock:
             self.active_peers = discovered_peers
@@ -99,25 +292,147 @@ class NetworkBlockchainMonitor:
         print(f"🎉 Discovery complete: {len(discovered_peers)} active peers found")
         return discovered_peers
     
-    def get_peer_blockchain_data(self, peer_url: str) -> Optional[Dict]:
-        """Get blockchain data from a specific peer"""
+    def _get_json_cached(self, url: str, ttl: float, timeout: float) -> Optional[Dict]:
+        """GET a JSON endpoint through the short-lived response cache"""
+        with self._cache_lock:
+            cached = self._response_cache.get(url)
+            if cached:
+                self._response_cache.move_to_end(url)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+        
+        # Revalidate with If-None-Match so an unchanged resource costs no body or parse
+        headers = {}
+        etag = self._etags.get(url)
+        if cached and etag:
+            headers['If-None-Match'] = etag
+        
         try:
-            response = requests.get(f"{peer_url}/blockchain", timeout=10)
+            response = self.session.get(url, timeout=timeout, headers=headers)
+            if response.status_code == 304 and cached:
+                self._store_response(url, ttl, cached[1])
+                return cached[1]
+            if response.status_code in (400, 404):
+                self._not_found.add(url)
             if response.status_code == 200:
-                return response.json()
-        except requests.RequestException:
+                payload = _json_loads(response.content)
+                self._store_response(url, ttl, payload, response.headers.get('ETag'))
+                return payload
+        except (requests.RequestException, ValueError):
             pass
+        
+        # Fall back to the last known payload during transient outages
+        if cached and time.monotonic() < cached[0] + self.stale_grace:
+            return cached[1]
         return None
     
+    def _store_response(self, url: str, ttl: float, payload: Dict, etag: Optional[str] = None):
+        """Insert or refresh a cache entry, evicting the least recently used past the cap"""
+        with self._cache_lock:
+            self._response_cache[url] = (time.monotonic() + ttl, payload)
+            self._response_cache.move_to_end(url)
+            if etag:
+                self._etags[url] = etag
+            while len(self._response_cache) > self.response_cache_size:
+                evicted, _ = self._response_cache.popitem(last=False)
+                self._etags.pop(evicted, None)
+    
+    def get_peer_blockchain_data(self, peer_url: str, since: int = 0) -> Optional[Dict]:
+        """Get blockchain data from a specific peer, optionally only blocks from index `since` on"""
+        url = f"{peer_url}/blockchain?since={since}" if since else f"{peer_url}/blockchain"
+        data = self._get_json_cached(url, self.cache_ttl['blockchain'], timeout=10)
+        if data is None and url in self._not_found:
+            # Nodes that reject ?since get one full fetch, sliced client-side
+            self._not_found.discard(url)
+            data = self._get_json_cached(f"{peer_url}/blockchain", self.cache_ttl['blockchain'], timeout=10)
+        return self._slice_since(data, since)
+    
+    def _slice_since(self, data: Optional[Dict], since: int) -> Optional[Dict]:
+        """Trim a full-chain payload down to blocks from `since` on"""
+        if data and since:
+            chain = data.get('chain', _EMPTY)
+            # Older nodes ignore ?since and still return the full chain
+            if chain and chain[0].get('index') != since:
+                data = dict(data, chain=chain[since:])
+        return data
+    
+    def get_peer_headers(self, peer_url: str) -> Optional[List[Dict]]:
+        """Get a peer's block headers (index, hash, previous_hash, ...) without transaction bodies"""
+        data = self._get_json_cached(f"{peer_url}/blockchain/headers", self.cache_ttl['blockchain'], timeout=10)
+        if data and 'headers' in data:
+            return data['headers']
+        
+        # Nodes without the headers endpoint still serve the full chain
+        data = self.get_peer_blockchain_data(peer_url)
+        return data['chain'] if data else None
+    
+    def get_peer_snapshot(self, peer_url: str, since: int = 0) -> Optional[Tuple[Dict, Dict]]:
+        """
+        Get (blockchain_data, status) from a peer's /snapshot endpoint in one request.
+        Returns None if the request failed or the peer predates /snapshot.
+        """
+        if self._supports_snapshot.get(peer_url) is False:
+            return None
+        
+        url = f"{peer_url}/snapshot?since={since}" if since else f"{peer_url}/snapshot"
+        data = self._get_json_cached(url, self.cache_ttl['blockchain'], timeout=10)
+        if url in self._not_found:
+            # Remember per peer so older nodes are not probed every tick
+            self._not_found.discard(url)
+            self._supports_snapshot[peer_url] = False
+            return None
+        if not data or 'blockchain' not in data or 'status' not in data:
+            return None
+        
+        self._supports_snapshot[peer_url] = True
+        return self._slice_since(data['blockchain'], since), data['status']
+    
+    def fetch_peer_data(self, peer_url: str, since: int = 0) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """Get (blockchain_data, status) for a peer, preferring a single /snapshot request"""
+        snapshot = self.get_peer_snapshot(peer_url, since)
+        if snapshot:
+            return snapshot
+        if self._supports_snapshot.get(peer_url) is False:
+            # Only a peer that answered 404 gets the two-request fallback
+            return self.get_peer_blockchain_data(peer_url, since), self.get_peer_status(peer_url)
+        # Timed out or refused - probing it twice more would just wait out two more timeouts
+        return None, None
+    
+    def _delta_start(self, peer_url: str) -> int:
+        """Index to fetch a peer's chain from - one block of overlap with what we hold"""
+        return max(0, len(self._peer_chains.get(peer_url, _EMPTY)) - 1)
+    
+    def _merge_peer_chain(self, peer_url: str, data: Dict, since: int) -> Optional[List[Dict]]:
+        """
+        Splice a delta fetched from `since` onto the chain held for this peer.
+        Returns None if the delta does not line up (reorg or shorter chain).
+        """
+        delta = data.get('chain', [])
+        cached = self._peer_chains.get(peer_url, [])
+        
+        soa = self._peer_soa.get(peer_url)
+        
+        if since == 0:
+            chain = delta
+            soa = _to_soa(chain)
+        elif delta and since < len(cached) and delta[0].get('hash') == cached[since].get('hash'):
+            # Only the overlap block came back - the chain we hold is still current
+            if len(delta) == 1 and len(cached) == since + 1:
+                chain = cached
+            else:
+                chain = cached[:since] + delta
+                tail = _to_soa(delta)
+                soa = {column: values[:since] + tail[column] for column, values in soa.items()}
+        else:
+            return None
+        
+        self._peer_chains[peer_url] = chain
+        self._peer_soa[peer_url] = soa
+        return chain
+    
     def get_peer_status(self, peer_url: str) -> Optional[Dict]:
         """Get status information from a specific peer"""
-        try:
-            response = requests.get(f"{peer_url}/status", timeout=5)
-            if response.status_code == 200:
-                return response.json()
-        except requests.RequestException:
-            pass
-        return None
+        return self._get_json_cached(f"{peer_url}/status", self.cache_ttl['status'], timeout=5)
     
     def get_consensus_ledger(self, peer_chains: Dict) -> Dict:
         """
@@ -136,7 +451,7 @@ class NetworkBlockchainMonitor:
             chain_length = len(chain)
             
             # Validate chain integrity
-            if self.is_valid_chain(chain):
+            if not self.verify_hash_chain(chain, fast=True, columns=self._peer_soa.get(peer_url)):
                 if chain_length > longest_length:
                     longest_length = chain_length
                     candidate_chains = [(peer_url, chain)]
@@ -155,7 +470,8 @@ class NetworkBlockchainMonitor:
             chain_groups = {}
             for peer_url, chain in candidate_chains:
                 # Create chain signature based on hashes
-                chain_sig = tuple(block['hash'] for block in chain)
+                hashes = peer_chains[peer_url].get('hashes')
+                chain_sig = tuple(hashes) if hashes is not None else tuple(block['hash'] for block in chain)
                 if chain_sig not in chain_groups:
                     chain_groups[chain_sig] = []
                 chain_groups[chain_sig].append((peer_url, chain))
@@ -183,11 +499,14 @@ class NetworkBlockchainMonitor:
         if not peer_chains:
             return
         
-        consensus_chain = consensus_ledger.get('consensus_chain', [])
+        consensus_chain = consensus_ledger.get('consensus_chain', _EMPTY)
         consensus_length = len(consensus_chain)
         total_nodes = len(peer_chains)
         consensus_count = consensus_ledger.get('consensus_count', 0)
         
+        consensus_hashes = (peer_chains.get(consensus_ledger.get('consensus_source'), {}).get('hashes')
+                            or [block['hash'] for block in consensus_chain])
+        
         # Check for nodes with different chain lengths
         nodes_with_issues = []
         for peer_url, peer_data in peer_chains.items():
@@ -196,25 +515,24 @@ class NetworkBlockchainMonitor:
             
             # Check if this node's chain differs from consensus
             if peer_length != consensus_length:
-                port = peer_url.split(':')[-1]
-                nodes_with_issues.append(f"Node-{port} ({peer_length} blocks)")
+                nodes_with_issues.append(f"{self._node_label(peer_url)} ({peer_length} blocks)")
             elif peer_length > 0 and consensus_length > 0:
-                # Check if same length but different blocks (fork)
-                for i in range(min(peer_length, consensus_length)):
-                    if i < len(peer_chain) and i < len(consensus_chain):
-                        if peer_chain[i]['hash'] != consensus_chain[i]['hash']:
-                            port = peer_url.split(':')[-1]
-                            nodes_with_issues.append(f"Node-{port} (fork at block #{i})")
-                            break
+                # Check if same length but different blocks (fork) - one C-level list compare first
+                peer_hashes = peer_data.get('hashes') or [block['hash'] for block in peer_chain]
+                if peer_hashes != consensus_hashes:
+                    fork_at = next(i for i, (a, b) in enumerate(zip(peer_hashes, consensus_hashes)) if a != b)
+                    nodes_with_issues.append(f"{self._node_label(peer_url)} (fork at block #{fork_at})")
         
         # Report consensus issues
         if nodes_with_issues:
-            print("⚠️  CONSENSUS ISSUES DETECTED:")
-            print(f"   🌐 Unified Ledger: {consensus_length} blocks ({consensus_count}/{total_nodes} nodes)")
-            print("   🍴 Nodes with different chains:")
-            for issue in nodes_with_issues:
-                print(f"      - {issue}")
-            print()
+            lines = [
+                "⚠️  CONSENSUS ISSUES DETECTED:",
+                f"   🌐 Unified Ledger: {consensus_length} blocks ({consensus_count}/{total_nodes} nodes)",
+                "   🍴 Nodes with different chains:",
+            ]
+            lines.extend(f"      - {issue}" for issue in nodes_with_issues)
+            lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
         elif total_nodes > 1 and consensus_count == total_nodes:
             # Perfect consensus - only report occasionally
             import random
@@ -227,44 +545,89 @@ class NetworkBlockchainMonitor:
         with self.peer_lock:
             if not self.active_peers:
                 return {'chain': [], 'peer_count': 0}
+            peers = list(self.active_peers)
+        
+        peer_results = {'blockchains': {}, 'statuses': {}}
+        
+        # Only pull blocks past what we already hold for each peer
+        since_by_peer = {peer_url: self._delta_start(peer_url) for peer_url in peers}
+        
+        # One /snapshot request per peer; peers without it get /blockchain and /status
+        # as independent requests, so the whole round costs roughly one RTT of the slowest peer
+        executor = self._pool
+        futures = {}
+        for peer_url in peers:
+            since = since_by_peer[peer_url]
+            if self._supports_snapshot.get(peer_url) is False:
+                futures[executor.submit(self.get_peer_blockchain_data, peer_url, since)] = ('blockchains', peer_url)
+                futures[executor.submit(self.get_peer_status, peer_url)] = ('statuses', peer_url)
+            else:
+                futures[executor.submit(self.fetch_peer_data, peer_url, since)] = ('snapshot', peer_url)
         
+        try:
+            for future in concurrent.futures.as_completed(futures, timeout=25):
+                try:
+                    result = future.result(timeout=2)
+                    kind, peer_url = futures[future]
+                    if kind == 'snapshot':
+                        blockchain_data, status = result
+                        if blockchain_data:
+                            peer_results['blockchains'][peer_url] = blockchain_data
+                        if status:
+                            peer_results['statuses'][peer_url] = status
+                    elif result:
+                        peer_results[kind][peer_url] = result
+                except concurrent.futures.TimeoutError:
+                    pass  # Skip slow peers
+                except Exception as e:
+                    pass  # Skip failed peers
+        except concurrent.futures.TimeoutError:
+            print(f"   ⏰ Data fetch timeout - continuing with available data")
+            # Cancel remaining futures
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+        
+        # Rebuild full chains from the deltas; a delta that no longer lines up
+        # (reorg or shorter chain) falls back to one full fetch for that peer
         peer_blockchains = {}
-        peer_statuses = {}
-        
-        def fetch_peer_data(peer_url: str) -> Tuple[str, Optional[Dict], Optional[Dict]]:
-            """Fetch both blockchain and status data from a peer"""
-            blockchain_data = self.get_peer_blockchain_data(peer_url)
-            status_data = self.get_peer_status(peer_url)
-            return peer_url, blockchain_data, status_data
-        
-        # Fetch data from all peers concurrently with improved error handling
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(fetch_peer_data, peer_url) 
-                      for peer_url in self.active_peers]
+        for peer_url, blockchain_data in peer_results['blockchains'].items():
+            chain = self._merge_peer_chain(peer_url, blockchain_data, since_by_peer[peer_url])
+            if chain is None:
+                blockchain_data = self.get_peer_blockchain_data(peer_url)
+                if not blockchain_data:
+                    self._peer_chains.pop(peer_url, None)
+                    self._peer_soa.pop(peer_url, None)
+                    continue
+                chain = self._merge_peer_chain(peer_url, blockchain_data, 0)
+            peer_blockchains[peer_url] = dict(blockchain_data, chain=chain)
             
-            try:
-                for future in concurrent.futures.as_completed(futures, timeout=25):
-                    try:
-                        peer_url, blockchain_data, status_data = future.result(timeout=2)
-                        if blockchain_data:
-                            peer_blockchains[peer_url] = blockchain_data
-                        if status_data:
-                            peer_statuses[peer_url] = status_data
-                    except concurrent.futures.TimeoutError:
-                        pass  # Skip slow peers
-                    except Exception as e:
-                        pass  # Skip failed peers
-            except concurrent.futures.TimeoutError:
-                print(f"   ⏰ Data fetch timeout - continuing with available data")
-                # Cancel remaining futures
-                for future in futures:
-                    if not future.done():
-                        future.cancel()
+            # Read attribution for newly fetched blocks once, at ingest
+            for block in blockchain_data.get('chain', _EMPTY):
+                self._block_metadata(block)
+        peer_statuses = peer_results['statuses']
+        
+        # Peers on the same chain share one list and column view: blocks commit to their
+        # ancestry, so an equal (length, tip hash) means identical content
+        chain_owner = {}
+        for peer_url, blockchain_data in peer_blockchains.items():
+            chain = blockchain_data['chain']
+            if not chain:
+                continue
+            owner = chain_owner.setdefault((len(chain), chain[-1]['hash']), peer_url)
+            if owner != peer_url and self._peer_chains[owner] is not chain:
+                blockchain_data['chain'] = self._peer_chains[peer_url] = self._peer_chains[owner]
+                self._peer_soa[peer_url] = self._peer_soa[owner]
+        
+        # Replaced as a whole each tick, so readers need no lock
+        self._peer_chain_lengths = {peer_url: len(blockchain_data['chain'])
+                                    for peer_url, blockchain_data in peer_blockchains.items()}
+        
+        self._prune_peer_state(peers)
         
         # Store peer data for analysis (cleared each run)
         with self.peer_lock:
-            # Clear previous data before storing new data
-            self.peer_data.clear()
+            # Swap in a fresh dict; readers holding the previous one are unaffected
             self.peer_data = {
                 'blockchains': peer_blockchains,
                 'statuses': peer_statuses
@@ -277,11 +640,21 @@ class NetworkBlockchainMonitor:
             if chain:  # Any chain with blocks
                 peer_chains[peer_url] = {
                     'chain': chain,
-                    'length': len(chain)
+                    'length': len(chain),
+                    'hashes': self._peer_soa[peer_url]['hashes']
                 }
         
-        # ENHANCED: Determine consensus ledger
-        consensus_info = self.get_consensus_ledger(peer_chains)
+        # Unchanged (length, tip hash) for every peer means nothing to re-validate
+        tips = {peer_url: (peer_data['length'], peer_data['hashes'][-1])
+                for peer_url, peer_data in peer_chains.items()}
+        if tips == self._peer_tips and self._last_consensus is not None:
+            consensus_info = self._last_consensus
+        else:
+            # ENHANCED: Determine consensus ledger
+            consensus_info = self.get_consensus_ledger(peer_chains)
+            self._peer_tips = tips
+            self._last_consensus = consensus_info
+            self._prune_block_caches(peer_chains)
         
         return {
             'peer_chains': peer_chains,
@@ -291,94 +664,131 @@ class NetworkBlockchainMonitor:
             'consensus_ledger': consensus_info
         }
     
-    def is_valid_chain(self, chain: List[Dict]) -> bool:
-        """Quick validation of blockchain integrity"""
-        if not chain:
-            return True
-        
-        for i in range(1, len(chain)):
-            if chain[i]['previous_hash'] != chain[i-1]['hash']:
-                return False
-        return True
-    
     def chains_match(self, chain1: List[Dict], chain2: List[Dict]) -> bool:
         """Check if two chains have matching blocks"""
         if len(chain1) != len(chain2):
             return False
         
-        for i in range(len(chain1)):
-            if chain1[i]['hash'] != chain2[i]['hash']:
-                return False
-        return True
+        return [block['hash'] for block in chain1] == [block['hash'] for block in chain2]
     
     def extract_miner_from_block(self, block: Dict, source_peer: str = None) -> tuple:
         """Extract miner address and mining node from block data with attribution preservation"""
-        try:
-            # First transaction should be coinbase
-            coinbase_tx = block['transactions'][0]
-            miner_address = "unknown"
-            if coinbase_tx['outputs']:
-                miner_address = coinbase_tx['outputs'][0]['recipient_address']
-            
-            # CRITICAL: Read actual mining node from block metadata
-            mining_node = "unknown"
-            
-            # Priority 1: Check mining_metadata (complete attribution info)
-            if 'mining_metadata' in block and isinstance(block['mining_metadata'], dict):
-                metadata = block['mining_metadata']
-                if 'mining_node' in metadata and metadata['mining_node']:
-                    mining_node = metadata['mining_node']
-                elif 'mining_provenance' in metadata and isinstance(metadata['mining_provenance'], dict):
-                    provenance = metadata['mining_provenance']
-                    if 'mining_node' in provenance and provenance['mining_node']:
-                        mining_node = provenance['mining_node']
-            
-            # Priority 2: Check direct mining_node field
-            elif 'mining_node' in block and block['mining_node']:
-                mining_node = block['mining_node']
-            
+        miner_address, mining_node, _ = self._block_metadata(block)
+        
+        if mining_node is None:
             # Priority 3: Try to infer from source peer information
-            elif source_peer:
+            if source_peer:
                 # If we know which peer this block came from, use that as fallback
-                peer_port = source_peer.split(':')[-1] if ':' in str(source_peer) else "unknown"
-                mining_node = f"Node-{peer_port}"
-            
+                mining_node = self._node_label(source_peer)
             # Priority 4: Default to unknown if no mining attribution found
             else:
                 mining_node = "unknown"
-            
-            return miner_address, mining_node
-            
-        except (KeyError, IndexError) as e:
-            # Fallback: Try to infer from context if available
-            if hasattr(self, '_current_source_peer') and self._current_source_peer:
-                peer_port = self._current_source_peer.split(':')[-1]
-                return "unknown", f"Node-{peer_port}"
-            return "unknown", "unknown"
+        
+        return miner_address, mining_node
+    
+    def _block_metadata(self, block: Dict) -> Tuple[str, Optional[str], Optional[float]]:
+        """
+        (miner_address, mining_node, reward) for a block, read once per block hash.
+        mining_node is None without attribution; reward is None without a coinbase output.
+        """
+        block_hash = block.get('hash')
+        meta = self._block_meta.get(block_hash) if block_hash else None
+        if meta is None:
+            miner_address, mining_node = self._read_block_attribution(block)
+            transactions = block.get('transactions') or [{}]
+            outputs = transactions[0].get('outputs') or []
+            reward = outputs[0].get('amount') if outputs else None
+            meta = (miner_address, mining_node, reward)
+            if block_hash:
+                self._block_meta[block_hash] = meta
+        return meta
+    
+    def _read_block_attribution(self, block: Dict) -> Tuple[str, Optional[str]]:
+        """Read (miner_address, mining_node) from a block; mining_node is None if the block carries no attribution"""
+        # First transaction should be coinbase
+        transactions = block.get('transactions') or [{}]
+        outputs = transactions[0].get('outputs') or []
+        miner_address = outputs[0].get('recipient_address', "unknown") if outputs else "unknown"
+        
+        # CRITICAL: Read actual mining node from block metadata
+        metadata = block.get('mining_metadata')
+        
+        # Priority 1: Check mining_metadata (complete attribution info)
+        if isinstance(metadata, dict):
+            provenance = metadata.get('mining_provenance')
+            if metadata.get('mining_node'):
+                return miner_address, metadata['mining_node']
+            if isinstance(provenance, dict) and provenance.get('mining_node'):
+                return miner_address, provenance['mining_node']
+            return miner_address, "unknown"
+        
+        # Priority 2: Check direct mining_node field
+        if block.get('mining_node'):
+            return miner_address, block['mining_node']
+        
+        return miner_address, None
+    
+    def _prune_peer_state(self, peers: List[str]):
+        """Forget per-peer state for departed peers and cache entries too old to serve"""
+        active = set(peers)
+        for peer_url in set(self._peer_chains) - active:
+            del self._peer_chains[peer_url]
+            self._peer_soa.pop(peer_url, None)
+        for per_peer in (self._supports_snapshot, self._peer_label):
+            for peer_url in set(per_peer) - active:
+                del per_peer[peer_url]
+        
+        live_keys = {'unified_ledger'} | {f"peer_{peer_url}" for peer_url in active}
+        for key in set(self.peer_last_seen) - live_keys:
+            del self.peer_last_seen[key]
+        
+        # Past expiry plus the stale grace an entry can never be served again; this
+        # also retires the one-off ?since= URLs left behind as chains grow
+        cutoff = time.monotonic() - self.stale_grace
+        with self._cache_lock:
+            for url in [url for url, (expires_at, _) in self._response_cache.items() if expires_at < cutoff]:
+                del self._response_cache[url]
+                self._etags.pop(url, None)
+    
+    def _prune_block_caches(self, peer_chains: Dict):
+        """Drop per-block metadata for blocks no peer holds anymore, once it has doubled"""
+        # Synced peers share one hash column, so each distinct chain is counted once
+        columns = list({id(peer_data['hashes']): peer_data['hashes'] for peer_data in peer_chains.values()}.values())
+        if len(self._block_meta) > 2 * sum(map(len, columns)) + 1024:
+            live = set().union(*columns)
+            self._block_meta = {block_hash: meta for block_hash, meta in self._block_meta.items()
+                                if block_hash in live}
+    
+    def _build_block_index(self, peer_chains: Dict):
+        """Map block hash -> (peer, index) for every peer holding it, walking each distinct chain once"""
+        holders = {}
+        for peer_url, peer_data in peer_chains.items():
+            chain = peer_data.get('chain', _EMPTY)
+            holders.setdefault(id(chain), (chain, []))[1].append(peer_url)
+        
+        block_index = defaultdict(list)
+        for chain, peers in holders.values():
+            for peer_block in chain:
+                index = peer_block.get('index')
+                block_index[peer_block.get('hash')].extend((peer_url, index) for peer_url in peers)
+        self._block_index = block_index
+        self._block_index_source = peer_chains
     
     def _check_block_consensus(self, block: Dict, peer_chains: Dict) -> Dict:
         """Check consensus status of a block across network nodes"""
-        consensus_count = 0
         total_nodes = len(peer_chains)
-        first_appearance = "unknown"
         
-        block_hash = block.get('hash', '')
+        # O(1) lookup in the hash map built once per set of peer chains; an unknown
+        # hash is rejected by a single string-keyed probe before any index matching
+        if self._block_index_source is not peer_chains:
+            self._build_block_index(peer_chains)
+        holders = self._block_index.get(block.get('hash', ''))
         block_index = block.get('index', -1)
+        peers = [peer_url for peer_url, index in holders if index == block_index] if holders else []
+        consensus_count = len(peers)
         
-        for peer_url, peer_data in peer_chains.items():
-            peer_chain = peer_data.get('chain', [])
-            
-            # Check if this block exists in this peer's chain
-            for peer_block in peer_chain:
-                if (peer_block.get('index') == block_index and 
-                    peer_block.get('hash') == block_hash):
-                    consensus_count += 1
-                    
-                    # Track first appearance (could enhance with timestamps)
-                    if first_appearance == "unknown":
-                        peer_port = peer_url.split(':')[-1]
-                        first_appearance = f"Node-{peer_port}"
-                    break
+        # Track first appearance (could enhance with timestamps)
+        first_appearance = self._node_label(peers[0]) if peers else "unknown"
         
         return {
             'consensus_count': consensus_count,
@@ -388,41 +798,89 @@ class NetworkBlockchainMonitor:
             'is_consensus': consensus_count > (total_nodes / 2)  # Majority consensus
         }
     
-    def verify_hash_chain(self, blocks: List[Dict]) -> List[Dict]:
-        """Verify the hash chain integrity and return issues"""
+    def verify_hash_chain(self, blocks: List[Dict], fast: bool = False,
+                          columns: Optional[Dict] = None) -> List[Dict]:
+        """
+        Verify the hash chain integrity and return issues.
+        With fast=True, stop at the first bad block. `columns` is the chain's _to_soa
+        view when the caller already holds one, so no per-block projection is needed.
+        """
+        return self._verify_block_range(blocks, 1, fast=fast, columns=columns)
+    
+    def verify_hash_chain_incremental(self, blocks: List[Dict]) -> List[Dict]:
+        """Verify only blocks appended since the last call and return their issues"""
+        start = self._incremental_start(blocks)
+        issues = self._verify_block_range(blocks, max(1, start))
+        self._issues.extend(issues)
+        
+        if blocks:
+            self.last_verified_index = len(blocks) - 1
+            self._last_verified_hash = blocks[-1]['hash']
+        return issues
+    
+    def _verify_block_range(self, blocks: List[Dict], start: int, fast: bool = False,
+                            columns: Optional[Dict] = None) -> List[Dict]:
+        """Check blocks[start:] against their predecessors; fast returns after the first bad block"""
         issues = []
-        
-        for i in range(1, len(blocks)):
-            current_block = blocks[i]
-            previous_block = blocks[i-1]
+        if start >= len(blocks):
+            return issues
+        
+        # Project the fields into flat lists once; whole-list comparisons run in C,
+        # so the per-block loop only has to visit blocks that actually failed
+        soa = columns if columns is not None and start == 1 else _to_soa(blocks[start - 1:])
+        hashes = soa['hashes']
+        prev_hashes = soa['prev_hashes']
+        indices = soa['indices']
+        links_ok = prev_hashes[1:] == hashes[:-1]
+        indices_ok = list(indices) == list(range(indices[0], indices[0] + len(indices)))
+        
+        # Locals for the per-block loop: one fast load each instead of global/attribute lookups
+        zero_prefix = _ZERO_PREFIX
+        all_linked = links_ok and indices_ok
+        
+        # Every block intact: the difficulty prefixes are checked in C as well, no loop needed
+        difficulties = soa['difficulties'][1:]
+        if all_linked and (not difficulties or max(difficulties) < len(zero_prefix)) and all(
+                map(str.startswith, hashes[1:], map(zero_prefix.__getitem__, difficulties))):
+            return issues
+        
+        for offset, (block_hash, difficulty) in enumerate(zip(hashes[1:], soa['difficulties'][1:]), 1):
+            required_zeros = zero_prefix[difficulty] if difficulty < 65 else "0" * difficulty
+            hash_ok = block_hash.startswith(required_zeros)
+            if hash_ok and all_linked:
+                continue
+            
+            block_index = indices[offset]
             
             # Check if current block's previous_hash matches previous block's hash
-            if current_block['previous_hash'] != previous_block['hash']:
+            if prev_hashes[offset] != hashes[offset - 1]:
                 issues.append({
                     'type': 'hash_mismatch',
-                    'block_index': current_block['index'],
-                    'expected_prev_hash': previous_block['hash'],
-                    'actual_prev_hash': current_block['previous_hash']
+                    'block_index': block_index,
+                    'expected_prev_hash': hashes[offset - 1],
+                    'actual_prev_hash': prev_hashes[offset]
                 })
             
             # Check if block index is sequential
-            if current_block['index'] != previous_block['index'] + 1:
+            if block_index != indices[offset - 1] + 1:
                 issues.append({
                     'type': 'index_gap',
-                    'block_index': current_block['index'],
-                    'expected_index': previous_block['index'] + 1,
-                    'actual_index': current_block['index']
+                    'block_index': block_index,
+                    'expected_index': indices[offset - 1] + 1,
+                    'actual_index': block_index
                 })
             
             # Check if hash starts with required zeros (difficulty)
-            required_zeros = "0" * current_block['target_difficulty']
-            if not current_block['hash'].startswith(required_zeros):
+            if not hash_ok:
                 issues.append({
                     'type': 'invalid_difficulty',
-                    'block_index': current_block['index'],
+                    'block_index': block_index,
                     'required_prefix': required_zeros,
-                    'actual_hash': current_block['hash'][:20] + "..."
+                    'actual_hash': block_hash[:20] + "..."
                 })
+            
+            if fast and issues:
+                break
         
         return issues
     
@@ -441,19 +899,19 @@ class NetworkBlockchainMonitor:
             
             # Get basic status
             try:
-                status_response = requests.get(f"{peer_url}/status", timeout=3)
+                status_response = self.session.get(f"{peer_url}/status", timeout=3)
                 if status_response.status_code == 200:
-                    metadata['basic_status'] = status_response.json()
+                    metadata['basic_status'] = _json_loads(status_response.content)
                 else:
                     metadata['errors'].append(f"Status HTTP {status_response.status_code}")
-            except requests.RequestException as e:
+            except (requests.RequestException, ValueError) as e:
                 metadata['errors'].append(f"Status error: {str(e)}")
             
             # Get enhanced chain information
             try:
-                chain_info_response = requests.get(f"{peer_url}/chain/info", timeout=3)
+                chain_info_response = self.session.get(f"{peer_url}/chain/info", timeout=3)
                 if chain_info_response.status_code == 200:
-                    metadata['chain_info'] = chain_info_response.json().get('chain_info', {})
+                    metadata['chain_info'] = _json_loads(chain_info_response.content).get('chain_info', {})
                     
                     # Verify genesis block
                     import sys
@@ -465,18 +923,18 @@ class NetworkBlockchainMonitor:
                     
                 else:
                     metadata['errors'].append(f"Chain info HTTP {chain_info_response.status_code}")
-            except requests.RequestException as e:
+            except (requests.RequestException, ValueError) as e:
                 metadata['errors'].append(f"Chain info error: {str(e)}")
             
             # Get recent blocks with full metadata
             try:
-                blocks_response = requests.get(f"{peer_url}/blocks/range?start=0&end=20", timeout=5)
+                blocks_response = self.session.get(f"{peer_url}/blocks/range?start=0&end=20", timeout=5)
                 if blocks_response.status_code == 200:
-                    blocks_data = blocks_response.json().get('blocks', [])
+                    blocks_data = _json_loads(blocks_response.content).get('blocks', [])
                     metadata['recent_blocks_metadata'] = self._analyze_blocks_comprehensive(blocks_data)
                 else:
                     metadata['errors'].append(f"Blocks HTTP {blocks_response.status_code}")
-            except requests.RequestException as e:
+            except (requests.RequestException, ValueError) as e:
                 metadata['errors'].append(f"Blocks error: {str(e)}")
             
             return metadata
@@ -630,11 +1088,53 @@ class NetworkBlockchainMonitor:
         return analysis
 
     def analyze_mining_distribution(self, blocks: List[Dict]) -> Dict:
-        """Analyze which core nodes mined which blocks across the network"""
-        miner_stats = {}
+        """Analyze which core nodes mined which blocks across the network
         
-        for block in blocks:
-            miner_address, mining_node = self.extract_miner_from_block(block)
+        Results are memoized by tip hash: an unchanged chain is answered from the cache,
+        and a chain extending a cached one only aggregates the new blocks.
+        Callers get their own copy, so modifying it cannot corrupt later results.
+        """
+        if not blocks:
+            return {}
+        
+        tip = blocks[-1]['hash']
+        cached = self._mining_cache.get(tip)
+        if cached and cached[0] == len(blocks):
+            self._mining_cache.move_to_end(tip)
+            return self._copy_miner_stats(cached[1])
+        
+        # Longest cached prefix of this chain, if any
+        base_length, base_stats = 0, None
+        for cached_tip, (length, stats) in self._mining_cache.items():
+            if base_length < length <= len(blocks) and blocks[length - 1]['hash'] == cached_tip:
+                base_length, base_stats = length, stats
+        
+        miner_stats = self._copy_miner_stats(base_stats) if base_stats else {}
+        self._accumulate_mining_stats(miner_stats, blocks[base_length:])
+        
+        self._mining_cache[tip] = (len(blocks), miner_stats)
+        if len(self._mining_cache) > self.mining_cache_size:
+            self._mining_cache.popitem(last=False)
+        return self._copy_miner_stats(miner_stats)
+    
+    def _copy_miner_stats(self, miner_stats: Dict) -> Dict:
+        """Copy of miner_stats down to the per-miner dicts and block index lists"""
+        return {key: dict(stats, block_indices=list(stats['block_indices']))
+                for key, stats in miner_stats.items()}
+    
+    def update_mining_distribution(self, new_blocks: List[Dict]) -> Dict:
+        """Fold newly observed blocks into the running miner_stats"""
+        return self._accumulate_mining_stats(self.miner_stats, new_blocks)
+    
+    def _accumulate_mining_stats(self, miner_stats: Dict, blocks: List[Dict]) -> Dict:
+        """Add each block's mining attribution and reward to miner_stats"""
+        # Project the needed columns once, then aggregate in a single zip pass
+        metas = [self._block_metadata(block) for block in blocks]
+        indices = [block['index'] for block in blocks]
+        
+        for block, (miner_address, mining_node, reward), index in zip(blocks, metas, indices):
+            if mining_node is None:
+                mining_node = "unknown"
             
             # Enhanced key with clear core identification
             if mining_node != "unknown":
@@ -642,43 +1142,48 @@ class NetworkBlockchainMonitor:
             else:
                 miner_key = f"Unknown-Core ({miner_address[:12]}...)"
             
-            if miner_key not in miner_stats:
-                miner_stats[miner_key] = {
+            stats = miner_stats.get(miner_key)
+            if stats is None:
+                stats = miner_stats[miner_key] = {
                     'miner_address': miner_address,
                     'mining_node': mining_node,
                     'core_identifier': miner_key,
                     'blocks_mined': 0,
                     'block_indices': [],
                     'total_rewards': 0.0,
-                    'first_block': block['index'],
-                    'last_block': block['index'],
+                    'first_block': index,
+                    'last_block': index,
                     'metadata_preserved': 'mining_metadata' in block or 'mining_node' in block
                 }
             
-            stats = miner_stats[miner_key]
             stats['blocks_mined'] += 1
-            stats['block_indices'].append(block['index'])
-            stats['last_block'] = block['index']
-            
-            # Calculate rewards from coinbase transaction
-            try:
-                coinbase_tx = block['transactions'][0]
-                if coinbase_tx['outputs']:
-                    stats['total_rewards'] += coinbase_tx['outputs'][0]['amount']
-            except (KeyError, IndexError):
-                pass
+            stats['block_indices'].append(index)
+            stats['last_block'] = index
+            stats['total_rewards'] += reward or 0.0
         
         return miner_stats
     
     def analyze_network_peer_status(self) -> Dict:
         """Analyze status of all network peers"""
         with self.peer_lock:
-            if not self.peer_data.get('statuses'):
-                return {}
-        
+            statuses = self.peer_data.get('statuses')
+        if not statuses:
+            return {}
+        
+        # statuses is swapped wholesale each poll, so identity tells whether it changed
+        cached = self._status_analysis
+        if cached and cached[0] is statuses:
+            return cached[1]
+        
+        # Peers whose status payload is the same object as last poll (cache hit or 304)
+        # keep their previous row
+        previous_statuses, previous_analysis = cached or ({}, {})
         peer_analysis = {}
         
-        for peer_url, status_data in self.peer_data['statuses'].items():
+        for peer_url, status_data in statuses.items():
+            if previous_statuses.get(peer_url) is status_data:
+                peer_analysis[peer_url] = previous_analysis[peer_url]
+                continue
             peer_analysis[peer_url] = {
                 'node_id': status_data.get('node_id', 'unknown'),
                 'blockchain_length': status_data.get('blockchain_length', 0),
@@ -690,21 +1195,21 @@ class NetworkBlockchainMonitor:
                 'thread_safe': status_data.get('thread_safe', False)
             }
         
+        self._status_analysis = (statuses, peer_analysis)
         return peer_analysis
     
     def display_network_status(self):
         """Display comprehensive network status with unified ledger info"""
-        print("🌐 UNIFIED NETWORK LEDGER STATUS")
-        print("=" * 50)
+        lines = ["🌐 UNIFIED NETWORK LEDGER STATUS", "=" * 50]
         
         # Get current data
         data = self.aggregate_network_data()
         consensus_ledger = data.get('consensus_ledger', {})
-        consensus_chain = consensus_ledger.get('consensus_chain', [])
+        consensus_chain = consensus_ledger.get('consensus_chain', _EMPTY)
         
         # Basic network stats
-        print(f"📊 Active Peers: {len(self.active_peers)}")
-        print(f"📝 Unified Ledger: {len(consensus_chain)} blocks")
+        lines.append(f"📊 Active Peers: {len(self.active_peers)}")
+        lines.append(f"📝 Unified Ledger: {len(consensus_chain)} blocks")
         
         # Consensus information
         consensus_count = consensus_ledger.get('consensus_count', 0)
@@ -712,89 +1217,88 @@ class NetworkBlockchainMonitor:
         consensus_percentage = consensus_ledger.get('consensus_percentage', 0)
         
         if total_nodes > 0:
-            print(f"🌐 Network Consensus: {consensus_count}/{total_nodes} nodes ({consensus_percentage:.1f}%)")
+            lines.append(f"🌐 Network Consensus: {consensus_count}/{total_nodes} nodes ({consensus_percentage:.1f}%)")
             if consensus_percentage >= 100:
-                print("✅ Perfect Consensus: All nodes agree on ledger state")
+                lines.append("✅ Perfect Consensus: All nodes agree on ledger state")
             elif consensus_percentage >= 80:
-                print("🟢 Strong Consensus: Majority agreement")
+                lines.append("🟢 Strong Consensus: Majority agreement")
             elif consensus_percentage >= 60:
-                print("🟡 Weak Consensus: Some disagreement detected")
+                lines.append("🟡 Weak Consensus: Some disagreement detected")
             else:
-                print("🔴 Poor Consensus: Significant network fragmentation")
+                lines.append("🔴 Poor Consensus: Significant network fragmentation")
         else:
-            print("⏳ No consensus data available")
+            lines.append("⏳ No consensus data available")
         
-        print()
+        lines.append("")
         
         # Peer details
         peer_analysis = self.analyze_network_peer_status()
         if peer_analysis:
-            print("📡 PEER DETAILS")
-            print("-" * 30)
+            lines.append("📡 PEER DETAILS")
+            lines.append("-" * 30)
             
             for peer_url, analysis in peer_analysis.items():
                 status_icon = "🟢" if analysis['thread_safe'] else "🟡"
-                print(f"{status_icon} {peer_url}")
-                print(f"   🆔 Node ID: {analysis['node_id']}")
-                print(f"   Chain Length: {analysis['blockchain_length']}")
-                print(f"   📝 Pending TXs: {analysis['pending_transactions']}")
-                print(f"   🌐 Connected Peers: {analysis['peers_connected']}")
-                print(f"   🎯 Difficulty: {analysis['target_difficulty']}")
-                print(f"   ⏱️  Uptime: {analysis['uptime']:.1f}s")
-                print(f"   📞 API Calls: {analysis['api_calls']}")
-                print()
-        
-        # Check for consensus issues
-        chains_by_length = defaultdict(int)
-        with self.peer_lock:
-            if self.peer_data.get('blockchains'):
-                for blockchain_data in self.peer_data['blockchains'].values():
-                    chain_length = len(blockchain_data.get('chain', []))
-                    chains_by_length[chain_length] += 1
+                lines.append(f"{status_icon} {peer_url}")
+                lines.append(f"   🆔 Node ID: {analysis['node_id']}")
+                lines.append(f"   Chain Length: {analysis['blockchain_length']}")
+                lines.append(f"   📝 Pending TXs: {analysis['pending_transactions']}")
+                lines.append(f"   🌐 Connected Peers: {analysis['peers_connected']}")
+                lines.append(f"   🎯 Difficulty: {analysis['target_difficulty']}")
+                lines.append(f"   ⏱️  Uptime: {analysis['uptime']:.1f}s")
+                lines.append(f"   📞 API Calls: {analysis['api_calls']}")
+                lines.append("")
+        
+        # Check for consensus issues - lengths are recorded per tick, so no lock or chain walk
+        chains_by_length = Counter(self._peer_chain_lengths.values())
         
         if len(chains_by_length) > 1:
-            print("⚠️  CONSENSUS WARNINGS")
-            print("-" * 25)
-            print("🔀 Different chain lengths detected:")
+            lines.append("⚠️  CONSENSUS WARNINGS")
+            lines.append("-" * 25)
+            lines.append("🔀 Different chain lengths detected:")
             for length, peer_count in sorted(chains_by_length.items(), reverse=True):
-                print(f"   {length} blocks: {peer_count} peer(s)")
-            print("   💡 Network may be experiencing forks or sync issues")
-            print()
+                lines.append(f"   {length} blocks: {peer_count} peer(s)")
+            lines.append("   💡 Network may be experiencing forks or sync issues")
+            lines.append("")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_peer_mining_comparison(self, miner_stats: Dict):
         """Display mining distribution with core node identification"""
-        print("🏭 CORE NODE MINING DISTRIBUTION")
-        print("=" * 60)
+        lines = ["🏭 CORE NODE MINING DISTRIBUTION", "=" * 60]
         
         total_blocks = sum(stats['blocks_mined'] for stats in miner_stats.values())
         
         if total_blocks == 0:
-            print("❌ No blocks mined yet in the network")
+            lines.append("❌ No blocks mined yet in the network")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
         
-        print(f"📊 Total blocks analyzed: {total_blocks}")
-        print(f"🏭 Active mining cores: {len(miner_stats)}")
-        print()
+        lines.append(f"📊 Total blocks analyzed: {total_blocks}")
+        lines.append(f"🏭 Active mining cores: {len(miner_stats)}")
+        lines.append("")
         
         # Display each core's mining performance
         for core_id, stats in sorted(miner_stats.items(), key=lambda x: x[1]['blocks_mined'], reverse=True):
             percentage = (stats['blocks_mined'] / total_blocks * 100) if total_blocks > 0 else 0
             
             # Enhanced core display
-            print(f"⛏️  {core_id}")
-            print(f"   📦 Blocks mined: {stats['blocks_mined']} ({percentage:.1f}%)")
-            print(f"   💰 Total rewards: {stats['total_rewards']:.2f} CC")
-            print(f"   🏷️  Miner address: {stats['miner_address']}")
-            print(f"   📊 Block range: #{stats['first_block']} → #{stats['last_block']}")
-            print(f"   🔗 Recent blocks: {stats['block_indices'][-5:]}")  # Show last 5 blocks
+            lines.append(f"⛏️  {core_id}")
+            lines.append(f"   📦 Blocks mined: {stats['blocks_mined']} ({percentage:.1f}%)")
+            lines.append(f"   💰 Total rewards: {stats['total_rewards']:.2f} CC")
+            lines.append(f"   🏷️  Miner address: {stats['miner_address']}")
+            lines.append(f"   📊 Block range: #{stats['first_block']} → #{stats['last_block']}")
+            lines.append(f"   🔗 Recent blocks: {stats['block_indices'][-5:]}")  # Show last 5 blocks
             
             # Show metadata preservation status
             if stats['metadata_preserved']:
-                print(f"   ✅ Mining attribution preserved")
+                lines.append(f"   ✅ Mining attribution preserved")
             else:
-                print(f"   ⚠️  Mining attribution missing")
+                lines.append(f"   ⚠️  Mining attribution missing")
             
-            print()
+            lines.append("")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def identify_miner_peer(self, miner_address: str, peer_analysis: Dict) -> Optional[str]:
         """Try to identify which peer a miner address belongs to"""
@@ -806,91 +1310,97 @@ class NetworkBlockchainMonitor:
     
     def display_block_details(self, block: Dict, is_new: bool = False, source_peer: str = None):
         """Display block information for unified ledger"""
-        miner_address, mining_node = self.extract_miner_from_block(block, source_peer)
-        timestamp = datetime.fromtimestamp(block['timestamp']).strftime("%H:%M:%S")
-        
-        # Enhanced display for unified ledger
-        print(f"   🔗 Hash: {block['hash'][:32]}...")
-        print(f"   ⬅️  Prev: {block['previous_hash'][:32]}...")
-        print(f"   ⏰ Time: {timestamp}")
-        print(f"   🎲 Nonce: {block['nonce']}")
+        sys.stdout.write("\n".join(self._block_detail_lines(block, source_peer)) + "\n")
+    
+    def _block_detail_lines(self, block: Dict, source_peer: str = None) -> List[str]:
+        """Output lines for one block, shared by the per-block and full-chain displays"""
+        # One metadata lookup serves attribution and reward
+        miner_address, mining_node, reward = self._block_metadata(block)
+        if mining_node is None:
+            mining_node = self._node_label(source_peer) if source_peer else "unknown"
+        timestamp = _format_block_time(int(block['timestamp']))
+        
+        # Enhanced display for unified ledger - built up and written in one call
+        lines = [
+            f"   🔗 Hash: {block['hash'][:32]}...",
+            f"   ⬅️  Prev: {block['previous_hash'][:32]}...",
+            f"   ⏰ Time: {timestamp}",
+            f"   🎲 Nonce: {block['nonce']}",
+        ]
         
         # Show mining attribution  
         if mining_node != "unknown":
-            print(f"   ⛏️  Mined by: {mining_node}")
+            lines.append(f"   ⛏️  Mined by: {mining_node}")
         else:
-            print(f"   ⛏️  Mined by: Unknown Node")
+            lines.append("   ⛏️  Mined by: Unknown Node")
         
         # Show miner address (truncated if long)
         if len(miner_address) > 40:
-            print(f"   🏷️  Address: {miner_address[:20]}...{miner_address[-15:]}")
+            lines.append(f"   🏷️  Address: {miner_address[:20]}...{miner_address[-15:]}")
         else:
-            print(f"   🏷️  Address: {miner_address}")
+            lines.append(f"   🏷️  Address: {miner_address}")
         
         # Show coinbase reward
-        try:
-            coinbase_tx = block['transactions'][0]
-            if coinbase_tx['outputs']:
-                reward = coinbase_tx['outputs'][0]['amount']
-                print(f"   💰 Reward: {reward} CC")
-        except (KeyError, IndexError):
-            pass
+        if reward is not None:
+            lines.append(f"   💰 Reward: {reward} CC")
         
         # Show transaction count
-        tx_count = len(block.get('transactions', []))
-        print(f"   📝 Transactions: {tx_count}")
+        tx_count = len(block.get('transactions', _EMPTY))
+        lines.append(f"   📝 Transactions: {tx_count}")
         
         # Show mining metadata if available
         if 'mining_metadata' in block:
             metadata = block['mining_metadata']
             if metadata.get('attribution_preserved'):
-                print(f"   ✅ Mining attribution preserved")
+                lines.append("   ✅ Mining attribution preserved")
         
-        print()
+        lines.append("")
+        return lines
     
     def display_mining_summary(self, miner_stats: Dict):
         """Display mining distribution summary"""
-        print("MINING DISTRIBUTION SUMMARY")
-        print("=" * 50)
+        lines = ["MINING DISTRIBUTION SUMMARY", "=" * 50]
         
         total_blocks = sum(stats['blocks_mined'] for stats in miner_stats.values())
         
         for miner, stats in sorted(miner_stats.items(), key=lambda x: x[1]['blocks_mined'], reverse=True):
             percentage = (stats['blocks_mined'] / total_blocks * 100) if total_blocks > 0 else 0
             
-            print(f"Miner: {miner[:30]}...")
-            print(f"  Blocks: {stats['blocks_mined']} ({percentage:.1f}%)")
-            print(f"  💰 Rewards: {stats['total_rewards']}")
-            print(f"  📊 Range: #{stats['first_block']} → #{stats['last_block']}")
-            print(f"  🏷️  Blocks: {stats['block_indices']}")
-            print()
+            lines.append(f"Miner: {miner[:30]}...")
+            lines.append(f"  Blocks: {stats['blocks_mined']} ({percentage:.1f}%)")
+            lines.append(f"  💰 Rewards: {stats['total_rewards']}")
+            lines.append(f"  📊 Range: #{stats['first_block']} → #{stats['last_block']}")
+            lines.append(f"  🏷️  Blocks: {stats['block_indices']}")
+            lines.append("")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_hash_chain_status(self, issues: List[Dict]):
         """Display hash chain integrity status"""
-        print("HASH CHAIN INTEGRITY")
-        print("=" * 30)
+        lines = ["HASH CHAIN INTEGRITY", "=" * 30]
         
         if not issues:
-            print("✅ Perfect hash chain - no issues detected!")
-            print("   • All previous_hash values match")
-            print("   • All block indices are sequential")
-            print("   • All hashes meet difficulty requirements")
+            lines.append("✅ Perfect hash chain - no issues detected!")
+            lines.append("   • All previous_hash values match")
+            lines.append("   • All block indices are sequential")
+            lines.append("   • All hashes meet difficulty requirements")
         else:
-            print(f"❌ {len(issues)} issues detected:")
+            lines.append(f"❌ {len(issues)} issues detected:")
             for issue in issues:
                 if issue['type'] == 'hash_mismatch':
-                    print(f"   Block #{issue['block_index']}: Hash mismatch")
-                    print(f"      Expected: {issue['expected_prev_hash'][:32]}...")
-                    print(f"      Actual:   {issue['actual_prev_hash'][:32]}...")
+                    lines.append(f"   Block #{issue['block_index']}: Hash mismatch")
+                    lines.append(f"      Expected: {issue['expected_prev_hash'][:32]}...")
+                    lines.append(f"      Actual:   {issue['actual_prev_hash'][:32]}...")
                 elif issue['type'] == 'index_gap':
-                    print(f"   📊 Block #{issue['block_index']}: Index gap")
-                    print(f"      Expected: #{issue['expected_index']}")
-                    print(f"      Actual:   #{issue['actual_index']}")
+                    lines.append(f"   📊 Block #{issue['block_index']}: Index gap")
+                    lines.append(f"      Expected: #{issue['expected_index']}")
+                    lines.append(f"      Actual:   #{issue['actual_index']}")
                 elif issue['type'] == 'invalid_difficulty':
-                    print(f"   🎯 Block #{issue['block_index']}: Invalid difficulty")
-                    print(f"      Required: starts with '{issue['required_prefix']}'")
-                    print(f"      Actual:   {issue['actual_hash']}")
-        print()
+                    lines.append(f"   🎯 Block #{issue['block_index']}: Invalid difficulty")
+                    lines.append(f"      Required: starts with '{issue['required_prefix']}'")
+                    lines.append(f"      Actual:   {issue['actual_hash']}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def monitor_realtime(self, interval: int = 5, rediscover_interval: int = 60):
         """Monitor blockchain across all network peers in real-time"""
@@ -904,17 +1414,25 @@ class NetworkBlockchainMonitor:
         
         # Clear all data before starting monitoring
         self._clear_all_data()
-        last_discovery = 0
+        self.cache_ttl['blockchain'] = max(1, interval - 1)
+        
+        # Deadlines on the monotonic clock, so wall-clock adjustments can't skew the schedule
+        current_time = time.monotonic()
+        last_discovery = current_time
+        next_rediscover = current_time
+        next_waiting_print = current_time
+        next_status_print = current_time + 30
         
         try:
             while True:
-                current_time = time.time()
+                current_time = time.monotonic()
                 
                 # Periodic peer rediscovery
-                if current_time - last_discovery > rediscover_interval:
+                if current_time >= next_rediscover:
                     print(f"🔄 Rediscovering peers...")
                     self.discover_active_peers()
                     last_discovery = current_time
+                    next_rediscover = current_time + rediscover_interval
                     print()
                 
                 # Skip if no peers found
@@ -971,13 +1489,22 @@ class NetworkBlockchainMonitor:
                     # Update tracking for the unified ledger
                     self.peer_last_seen[network_key] = current_ledger_length
                     new_blocks_found = True
+                    self._record_block_arrival(consensus_chain[last_ledger_length:current_ledger_length])
+                    
+                    # Fold only the unseen tail into mining stats and integrity checks
+                    start = self._incremental_start(consensus_chain)
+                    self.update_mining_distribution(consensus_chain[start:])
+                    new_issues = self.verify_hash_chain_incremental(consensus_chain)
+                    if new_issues:
+                        self.display_hash_chain_status(new_issues)
                 
                 # Check for consensus issues (forks or disagreements)
                 peer_chains = data.get('peer_chains', {})
                 self._check_and_report_consensus_issues(peer_chains, consensus_ledger)
                 
                 # If no new blocks found, show waiting message occasionally
-                if not new_blocks_found and current_time % 10 < interval:
+                if not new_blocks_found and current_time >= next_waiting_print:
+                    next_waiting_print = current_time + 10
                     print("⏳ Monitoring unified network ledger for new blocks...")
                     consensus_count = consensus_ledger.get('consensus_count', 0)
                     total_nodes = consensus_ledger.get('total_nodes', 0)
@@ -986,61 +1513,84 @@ class NetworkBlockchainMonitor:
                     print(f"   🌐 Network Consensus: {consensus_count}/{total_nodes} nodes")
                 else:
                     # Show periodic status updates even without new blocks
-                    if int(current_time) % 30 == 0:  # Every 30 seconds
+                    if current_time >= next_status_print:  # Every 30 seconds
+                        next_status_print = current_time + 30
                         ledger_length = len(consensus_chain)
                         consensus_count = consensus_ledger.get('consensus_count', 0)
                         total_nodes = consensus_ledger.get('total_nodes', 0)
                         print(f"💭 Network status: {len(self.active_peers)} peers, unified ledger: {ledger_length} blocks")
                         print(f"   🌐 Consensus: {consensus_count}/{total_nodes} nodes agree")
                 
-                time.sleep(interval)
+                # Poll faster on busy networks and back off on idle ones
+                next_sleep = self._next_poll_interval(interval)
+                self.cache_ttl['blockchain'] = max(1, next_sleep - 1)
+                
+                # Sleep to the next tick measured from this tick's start, not from now
+                time.sleep(max(0, current_time + next_sleep - time.monotonic()))
                 
         except KeyboardInterrupt:
             print("\n👋 Network monitoring stopped")
+            if self.miner_stats:
+                self.display_peer_mining_comparison(self.miner_stats)
+            self.close()
     
     def display_network_consensus_summary(self, data: Dict):
         """Display network consensus information"""
-        print("🎯 NETWORK CONSENSUS STATUS")
-        print("-" * 40)
+        lines = ["🎯 NETWORK CONSENSUS STATUS", "-" * 40]
         
         total_peers = data.get('peer_count', 0)
         consensus_peers = data.get('consensus_peers', 0)
-        longest_chain = data.get('chain', [])
+        longest_chain = data.get('chain', _EMPTY)
         
         if total_peers == 0:
-            print("❌ No peers responding")
+            lines.append("❌ No peers responding")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
         
         consensus_percentage = (consensus_peers / total_peers * 100) if total_peers > 0 else 0
         
-        print(f"📊 Consensus: {consensus_peers}/{total_peers} peers ({consensus_percentage:.1f}%)")
-        print(f"Canonical Chain: {len(longest_chain)} blocks")
+        lines.append(f"📊 Consensus: {consensus_peers}/{total_peers} peers ({consensus_percentage:.1f}%)")
+        lines.append(f"Canonical Chain: {len(longest_chain)} blocks")
         
         if consensus_percentage >= 80:
-            print("✅ Strong consensus - network is stable")
+            lines.append("✅ Strong consensus - network is stable")
         elif consensus_percentage >= 60:
-            print("⚠️  Weak consensus - possible fork in progress")
+            lines.append("⚠️  Weak consensus - possible fork in progress")
         else:
-            print("❌ Poor consensus - network fragmentation detected")
+            lines.append("❌ Poor consensus - network fragmentation detected")
         
         # Show any chain conflicts
         with self.peer_lock:
-            if self.peer_data.get('blockchains'):
-                chain_lengths = {}
-                for peer_url, blockchain_data in self.peer_data['blockchains'].items():
-                    chain_length = len(blockchain_data.get('chain', []))
-                    if chain_length not in chain_lengths:
-                        chain_lengths[chain_length] = []
-                    chain_lengths[chain_length].append(peer_url)
+            blockchains = self.peer_data.get('blockchains')
+        if blockchains:
+            # Each block hash commits to its whole ancestry, so (length, tip hash) identifies
+            # a chain - peers with equal lengths but different tips are on competing forks
+            peer_heads = {}
+            for peer_url, blockchain_data in blockchains.items():
+                chain = blockchain_data.get('chain', _EMPTY)
+                peer_heads[peer_url] = (len(chain), chain[-1].get('hash', '') if chain else '')
+            
+            # Stable network: every peer holds the same chain, nothing to bucket or sort
+            if len(set(peer_heads.values())) > 1:
+                chains = defaultdict(list)
+                for peer_url, head in peer_heads.items():
+                    chains[head].append(peer_url)
+                tips_per_length = Counter(length for length, _ in chains)
                 
-                if len(chain_lengths) > 1:
-                    print("\n🔀 Chain length conflicts:")
-                    for length, peers in sorted(chain_lengths.items(), reverse=True):
-                        print(f"   {length} blocks: {len(peers)} peer(s)")
-                        for peer in peers:
-                            print(f"      • {peer}")
-        
-        print()
+                if len(tips_per_length) > 1:
+                    lines.append("\n🔀 Chain length conflicts:")
+                else:
+                    lines.append("\n🔀 Competing forks at equal length:")
+                for length, tip in sorted(chains, reverse=True):
+                    peers = chains[length, tip]
+                    if tips_per_length[length] > 1:
+                        lines.append(f"   {length} blocks (tip {tip[:16]}...): {len(peers)} peer(s)")
+                    else:
+                        lines.append(f"   {length} blocks: {len(peers)} peer(s)")
+                    lines.extend(f"      • {peer}" for peer in peers)
+        
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def full_analysis(self):
         """Perform complete network-wide blockchain analysis"""
@@ -1060,26 +1610,34 @@ class NetworkBlockchainMonitor:
         
         # Get aggregated network data
         data = self.aggregate_network_data()
-        if not data or not data.get('chain'):
+        ledger = data.get('consensus_ledger') or {}
+        blocks = ledger.get('consensus_chain')
+        if not blocks:
             print("❌ Cannot retrieve blockchain data from network")
             return
         
-        blocks = data['chain']
+        # The consensus summary reads the canonical chain and agreeing peer count
+        data = dict(data, chain=blocks, consensus_peers=ledger.get('consensus_count', 0))
         
         print(f"Total blocks: {len(blocks)}")
         print(f"🌐 Active peers: {len(self.active_peers)}")
-        print(f"🎯 Consensus: {data.get('consensus_peers', 0)}/{data.get('peer_count', 0)} peers")
+        print(f"🎯 Consensus: {data['consensus_peers']}/{data.get('peer_count', 0)} peers")
         print(f"Analysis time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print()
         
         # Network status overview
         self.display_network_status()
         
-        # Show all blocks
-        print("📋 COMPLETE NETWORK BLOCKCHAIN")
-        print("-" * 40)
+        # Show all blocks - one buffered write for the whole chain instead of one per block
+        buffer = io.StringIO()
+        buffer.write("📋 COMPLETE NETWORK BLOCKCHAIN\n")
+        buffer.write("-" * 40 + "\n")
+        detail_lines = self._block_detail_lines
+        write = buffer.write
         for block in blocks:
-            self.display_block_details(block)
+            write("\n".join(detail_lines(block)))
+            write("\n")
+        sys.stdout.write(buffer.getvalue())
         
         # Network-wide mining analysis
         miner_stats = self.analyze_mining_distribution(blocks)
@@ -1092,6 +1650,162 @@ class NetworkBlockchainMonitor:
         # Network consensus analysis
         self.display_network_consensus_summary(data)
 
+class LegacyBlockchainMonitor:
+    """Single-node monitor reusing NetworkBlockchainMonitor's fetch, display and verification"""
+    def __init__(self, node_url: str):
+        self.node_url = node_url
+        self.last_seen_length = 0
+        self.last_block: Optional[Dict] = None  # Only the tip is kept between polls
+        
+        # Use methods from NetworkBlockchainMonitor
+        self.network_monitor = NetworkBlockchainMonitor()
+    
+    def get_blockchain_data(self, since: int = 0):
+        return self.network_monitor.get_peer_blockchain_data(self.node_url, since=since)
+    
+    def monitor_realtime(self, interval: int):
+        print(f"Monitoring {self.node_url} every {interval} seconds...")
+        print("Press Ctrl+C to stop\n")
+        monitor = self.network_monitor
+        monitor.cache_ttl['blockchain'] = max(1, interval - 1)
+        
+        # Bind the per-tick calls once instead of resolving them through self on every poll
+        get_status = monitor.get_peer_status
+        get_blocks = monitor.get_peer_blockchain_data
+        display_block = monitor.display_block_details
+        
+        try:
+            while True:
+                # Cheap /status probe first; only pull blocks when the chain grew
+                status = get_status(self.node_url)
+                if not status:
+                    print("⏳ Waiting for node connection...")
+                    time.sleep(interval)
+                    continue
+                
+                current_length = status.get('blockchain_length', 0)
+                
+                if current_length > self.last_seen_length:
+                    data = get_blocks(self.node_url, since=self.last_seen_length)
+                    if data and data['chain']:
+                        new_blocks = data['chain']
+                        for block in new_blocks:
+                            display_block(block, is_new=True)
+                        
+                        # Verify and attribute the delta against the retained tip only
+                        window = [self.last_block] + new_blocks if self.last_block else new_blocks
+                        issues = monitor.verify_hash_chain(window)
+                        if issues:
+                            monitor.display_hash_chain_status(issues)
+                        monitor.update_mining_distribution(new_blocks)
+                        monitor._record_block_arrival(new_blocks)
+                        
+                        self.last_block = new_blocks[-1]
+                        self.last_seen_length += len(new_blocks)
+                
+                next_sleep = monitor._next_poll_interval(interval)
+                monitor.cache_ttl['status'] = min(2.0, next_sleep / 2)
+                time.sleep(next_sleep)
+        
+        except KeyboardInterrupt:
+            print("\n👋 Monitoring stopped")
+            if monitor.miner_stats:
+                monitor.display_mining_summary(monitor.miner_stats)
+            monitor.close()
+
+def _cmd_monitor(args: List[str]):
+    """Network-wide realtime monitoring"""
+    start_port = int(args[0]) if args else 5000
+    end_port = int(args[1]) if len(args) > 1 else 5010
+    interval = int(args[2]) if len(args) > 2 else 5
+    
+    monitor = NetworkBlockchainMonitor(start_port, end_port)
+    monitor.monitor_realtime(interval)
+
+def _cmd_analyze(args: List[str]):
+    """One-off network-wide analysis"""
+    start_port = int(args[0]) if args else 5000
+    end_port = int(args[1]) if len(args) > 1 else 5010
+    
+    monitor = NetworkBlockchainMonitor(start_port, end_port)
+    monitor.full_analysis()
+
+def _cmd_compare(args: List[str]):
+    """Compare the chains held by two nodes"""
+    url1 = args[0] if args else "http://localhost:5000"
+    url2 = args[1] if len(args) > 1 else "http://localhost:5001"
+    
+    print("Comparing two blockchain nodes")
+    print("=" * 40)
+    
+    # Use the new network monitor for better comparison
+    monitor = NetworkBlockchainMonitor()
+    
+    # Only hashes are compared, so fetch headers rather than full blocks - both
+    # nodes concurrently, so wall time is max(t1, t2) instead of t1 + t2
+    future1 = monitor._pool.submit(monitor.get_peer_headers, url1)
+    future2 = monitor._pool.submit(monitor.get_peer_headers, url2)
+    blocks1, blocks2 = future1.result(), future2.result()
+    
+    if blocks1 is not None and blocks2 is not None:
+        print(f"Node 1 ({url1}): {len(blocks1)} blocks")
+        print(f"Node 2 ({url2}): {len(blocks2)} blocks")
+        
+        # Blocks commit to their predecessor's hash, so once the chains diverge every
+        # later block differs too: matching tips mean the shared prefix matches, and
+        # otherwise the first divergence can be found by bisection
+        min_length = min(len(blocks1), len(blocks2))
+        first_diff = min_length
+        if min_length and blocks1[min_length - 1]['hash'] != blocks2[min_length - 1]['hash']:
+            lo, hi = 0, min_length - 1
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if blocks1[mid]['hash'] == blocks2[mid]['hash']:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            first_diff = lo
+        
+        diff_indices = [i for i in range(first_diff, min_length) if blocks1[i]['hash'] != blocks2[i]['hash']]
+        differences = len(diff_indices)
+        
+        for i in diff_indices:
+            print(f"❌ Block #{i} differs:")
+            print(f"   Node 1: {blocks1[i]['hash'][:32]}...")
+            print(f"   Node 2: {blocks2[i]['hash'][:32]}...")
+        
+        if differences == 0 and len(blocks1) == len(blocks2):
+            print("✅ Nodes are perfectly synchronized!")
+        elif differences == 0:
+            print(f"✅ Synchronized up to block #{min_length-1}")
+            print(f"📊 Length difference: {abs(len(blocks1) - len(blocks2))} blocks")
+        else:
+            print(f"❌ {differences} block differences detected!")
+    else:
+        print("❌ Could not connect to one or both nodes")
+
+def _cmd_legacy(args: List[str]):
+    """Single-node monitoring"""
+    # Legacy single-node monitoring mode
+    node_url = args[0] if args else "http://localhost:5000"
+    interval = int(args[1]) if len(args) > 1 else 3
+    
+    print("🔄 Legacy single-node monitoring mode")
+    print(f"Monitoring: {node_url}")
+    print("💡 Use 'monitor' command for network-wide monitoring")
+    print()
+    
+    legacy_monitor = LegacyBlockchainMonitor(node_url)
+    legacy_monitor.monitor_realtime(interval)
+
+# Subcommand name -> handler taking the remaining positional arguments
+COMMANDS = {
+    "monitor": _cmd_monitor,
+    "analyze": _cmd_analyze,
+    "compare": _cmd_compare,
+    "legacy": _cmd_legacy,
+}
+
 def main():
     if len(sys.argv) < 2:
         print("🚀 ChainCore Network-Wide Blockchain Monitor")
@@ -1112,117 +1826,13 @@ def main():
         return
     
     command = sys.argv[1]
-    
-    if command == "monitor":
-        start_port = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
-        end_port = int(sys.argv[3]) if len(sys.argv) > 3 else 5010
-        interval = int(sys.argv[4]) if len(sys.argv) > 4 else 5
-        
-        monitor = NetworkBlockchainMonitor(start_port, end_port)
-        monitor.monitor_realtime(interval)
-    
-    elif command == "analyze":
-        start_port = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
-        end_port = int(sys.argv[3]) if len(sys.argv) > 3 else 5010
-        
-        monitor = NetworkBlockchainMonitor(start_port, end_port)
-        monitor.full_analysis()
-    
-    elif command == "compare":
-        url1 = sys.argv[2] if len(sys.argv) > 2 else "http://localhost:5000"
-        url2 = sys.argv[3] if len(sys.argv) > 3 else "http://localhost:5001"
-        
-        print("Comparing two blockchain nodes")
-        print("=" * 40)
-        
-        # Use the new network monitor for better comparison
-        monitor = NetworkBlockchainMonitor()
-        
-        data1 = monitor.get_peer_blockchain_data(url1)
-        data2 = monitor.get_peer_blockchain_data(url2)
-        
-        if data1 and data2:
-            blocks1 = data1['chain']
-            blocks2 = data2['chain']
-            
-            print(f"Node 1 ({url1}): {len(blocks1)} blocks")
-            print(f"Node 2 ({url2}): {len(blocks2)} blocks")
-            
-            # Compare hash chains
-            min_length = min(len(blocks1), len(blocks2))
-            differences = 0
-            
-            for i in range(min_length):
-                if blocks1[i]['hash'] != blocks2[i]['hash']:
-                    differences += 1
-                    print(f"❌ Block #{i} differs:")
-                    print(f"   Node 1: {blocks1[i]['hash'][:32]}...")
-                    print(f"   Node 2: {blocks2[i]['hash'][:32]}...")
-            
-            if differences == 0 and len(blocks1) == len(blocks2):
-                print("✅ Nodes are perfectly synchronized!")
-            elif differences == 0:
-                print(f"✅ Synchronized up to block #{min_length-1}")
-                print(f"📊 Length difference: {abs(len(blocks1) - len(blocks2))} blocks")
-            else:
-                print(f"❌ {differences} block differences detected!")
-        else:
-            print("❌ Could not connect to one or both nodes")
-    
-    elif command == "legacy":
-        # Legacy single-node monitoring mode
-        node_url = sys.argv[2] if len(sys.argv) > 2 else "http://localhost:5000"
-        interval = int(sys.argv[3]) if len(sys.argv) > 3 else 3
-        
-        print("🔄 Legacy single-node monitoring mode")
-        print(f"Monitoring: {node_url}")
-        print("💡 Use 'monitor' command for network-wide monitoring")
-        print()
-        
-        # Create a simple single-node monitor using the legacy class
-        class LegacyBlockchainMonitor:
-            def __init__(self, node_url: str):
-                self.node_url = node_url
-                self.last_seen_length = 0
-                
-                # Use methods from NetworkBlockchainMonitor
-                self.network_monitor = NetworkBlockchainMonitor()
-            
-            def get_blockchain_data(self):
-                return self.network_monitor.get_peer_blockchain_data(self.node_url)
-            
-            def monitor_realtime(self, interval: int):
-                print(f"Monitoring {self.node_url} every {interval} seconds...")
-                print("Press Ctrl+C to stop\n")
-                
-                try:
-                    while True:
-                        data = self.get_blockchain_data()
-                        if not data:
-                            print("⏳ Waiting for node connection...")
-                            time.sleep(interval)
-                            continue
-                        
-                        blocks = data['chain']
-                        current_length = len(blocks)
-                        
-                        if current_length > self.last_seen_length:
-                            for i in range(self.last_seen_length, current_length):
-                                if i < len(blocks):
-                                    self.network_monitor.display_block_details(blocks[i], is_new=True)
-                            self.last_seen_length = current_length
-                        
-                        time.sleep(interval)
-                        
-                except KeyboardInterrupt:
-                    print("\n👋 Monitoring stopped")
-        
-        legacy_monitor = LegacyBlockchainMonitor(node_url)
-        legacy_monitor.monitor_realtime(interval)
-    
-    else:
+    handler = COMMANDS.get(command)
+    if handler is None:
         print(f"❌ Unknown command: {command}")
         print("Use 'python3 blockchain_monitor.py' to see available commands")
+        return
+    
+    handler(sys.argv[2:])
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -29,6 +29,9 @@ class DatabaseMonitor:
         self.last_tx_count = 0
         self.start_time = time.time()
         self.running = False
+        
+        # Keep-alive HTTP session for node status polls, created on first use
+        self.http_session = None
     
     def start_monitoring(self, refresh_interval: float = 2.0):
         """Start real-time monitoring"""
@@ -64,6 +67,8 @@ class DatabaseMonitor:
         except KeyboardInterrupt:
             print("\nMonitor stopped by user")
             self.running = False
+            if self.http_session is not None:
+                self.http_session.close()
     
     def _check_for_updates(self):
         """Check for new blocks and transactions"""
@@ -96,12 +101,14 @@ class DatabaseMonitor:
     def _show_network_activity(self):
         """Show which nodes are currently active"""
         import requests
+        if self.http_session is None:
+            self.http_session = requests.Session()
         active_nodes = []
         
-        # Check common node ports
+        # Check common node ports - pooled connections are reused across refreshes
         for port in range(5000, 5010):
             try:
-                response = requests.get(f"http://localhost:{port}/status", timeout=1)
+                response = self.http_session.get(f"http://localhost:{port}/status", timeout=1)
                 if response.status_code == 200:
                     data = response.json()
                     node_id = data.get('node_id', f'port-{port}')
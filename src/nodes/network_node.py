@@ -381,65 +381,7 @@ class ThreadSafeNetworkNode:
             """Status endpoint with information"""
             self._increment_api_calls()
             
-            # Get current statistics
-            blockchain_length = self.blockchain.get_chain_length()
-            pending_txs = len(self.blockchain.get_transaction_pool_copy())
-            peer_status = self.peer_network_manager.get_status()
-            active_peers = peer_status.get('active_peers', 0)
-            total_peers = peer_status.get('total_peers', 0)
-            uptime_seconds = time.time() - self._stats['uptime_start']
-            
-            # Calculate uptime in human readable format
-            uptime_hours = int(uptime_seconds // 3600)
-            uptime_minutes = int((uptime_seconds % 3600) // 60)
-            uptime_readable = f"{uptime_hours}h {uptime_minutes}m" if uptime_hours > 0 else f"{uptime_minutes}m"
-            
-            # Determine network health status
-            if active_peers == 0:
-                network_health = "Single Node Mode"
-            elif active_peers < self.peer_network_manager.target_outbound_connections:
-                network_health = "Seeking More Peers"
-            else:
-                network_health = "Well Connected"
-
-            # Determine node role (simplified)
-            node_role = "Peer Node"
-
-            # Get mining difficulty status
-            difficulty_status = "Hard" if self.blockchain.target_difficulty > 4 else "Moderate"
-
-            status_summary = f"""
-+======================================================================+
-|                    CHAINCORE NODE STATUS                            |
-+======================================================================+
-| Node: {self.node_id:<20} Port: {self.api_port:<20}              |
-| Status: ONLINE & OPERATIONAL      Uptime: {uptime_readable:<15}   |
-| Chain: {blockchain_length:,} blocks{' + ' + str(pending_txs) + ' pending' if pending_txs > 0 else '':20}   |
-| Peers: {active_peers} connected ({total_peers} known)                      |
-| Difficulty: {self.blockchain.target_difficulty} {difficulty_status:<30}   |
-+======================================================================+
-            """.strip()
-
-            return jsonify({
-                'STATUS_DISPLAY': status_summary,
-                'node_id': self.node_id,
-                'blockchain_length': blockchain_length,
-                'pending_transactions': pending_txs,
-                'peers': active_peers,
-                'total_peers': total_peers,
-                'node_role': node_role,
-                'target_difficulty': self.blockchain.target_difficulty,
-                'network_health': network_health,
-                'uptime': uptime_seconds,
-                'version': '2.0', # Updated version
-                'thread_safe': True,  # Mining client expects this field
-                'status': 'online',
-                'node_info': {
-                    'thread_safe': True,
-                    'initialized': blockchain_length > 0,
-                    'operational': True
-                }
-            })
+            return jsonify(self._status_payload())
         
         @self.app.route('/status/human', methods=['GET'])
         @self.app.route('/', methods=['GET'])  # Also serve on root URL
@@ -544,11 +486,53 @@ class ThreadSafeNetworkNode:
             self._increment_api_calls()
             
             chain_copy = self.blockchain.get_chain_copy()
-            return jsonify({
+            
+            # Optional delta fetch: ?since=<index> returns only blocks from that index on
+            since = max(0, request.args.get('since', 0, type=int))
+            
+            # Conditional GET: unchanged chains answer 304 without serializing blocks
+            tip_hash = chain_copy[-1].hash if chain_copy else ''
+            etag = f"{len(chain_copy)}-{tip_hash}-{since}"
+            if request.if_none_match.contains(etag):
+                return '', 304, {'ETag': f'"{etag}"'}
+            
+            response = jsonify({
                 'length': len(chain_copy),
-                'chain': [block.to_dict() for block in chain_copy]
+                'since': since,
+                'chain': [block.to_dict() for block in chain_copy[since:]]
             })
+            response.set_etag(etag)
+            return response
         
+        @self.app.route('/snapshot', methods=['GET'])
+        @synchronized("api_snapshot", LockOrder.NETWORK, mode='read')
+        def get_snapshot():
+            """Blockchain and status in one response, so monitors need one round trip per node"""
+            self._increment_api_calls()
+            
+            chain_copy = self.blockchain.get_chain_copy()
+            since = max(0, request.args.get('since', 0, type=int))
+            # Length taken from the chain copy served below, not a second read
+            status = self._status_payload(len(chain_copy))
+            
+            # ETag covers node state only - uptime ticks on every call and would defeat 304s
+            tip_hash = chain_copy[-1].hash if chain_copy else ''
+            etag = (f"{len(chain_copy)}-{tip_hash}-{since}-{status['pending_transactions']}-"
+                    f"{status['peers']}-{status['total_peers']}-{status['target_difficulty']}")
+            if request.if_none_match.contains(etag):
+                return '', 304, {'ETag': f'"{etag}"'}
+            
+            response = jsonify({
+                'status': status,
+                'blockchain': {
+                    'length': len(chain_copy),
+                    'since': since,
+                    'chain': [block.to_dict() for block in chain_copy[since:]]
+                }
+            })
+            response.set_etag(etag)
+            return response
+
         @self.app.route('/blockchain/headers', methods=['GET'])
         @synchronized("api_blockchain_headers", LockOrder.NETWORK, mode='read')
         def get_blockchain_headers():
@@ -1574,6 +1558,69 @@ class ThreadSafeNetworkNode:
         with self._stats_lock:
             self._stats['api_calls'] += 1
     
+    def _status_payload(self, blockchain_length: Optional[int] = None) -> Dict:
+        """Status served by /status and embedded in /snapshot, so both stay identical"""
+        # Get current statistics
+        if blockchain_length is None:
+            blockchain_length = self.blockchain.get_chain_length()
+        pending_txs = len(self.blockchain.get_transaction_pool_copy())
+        peer_status = self.peer_network_manager.get_status()
+        active_peers = peer_status.get('active_peers', 0)
+        total_peers = peer_status.get('total_peers', 0)
+        uptime_seconds = time.time() - self._stats['uptime_start']
+        
+        # Calculate uptime in human readable format
+        uptime_hours = int(uptime_seconds // 3600)
+        uptime_minutes = int((uptime_seconds % 3600) // 60)
+        uptime_readable = f"{uptime_hours}h {uptime_minutes}m" if uptime_hours > 0 else f"{uptime_minutes}m"
+        
+        # Determine network health status
+        if active_peers == 0:
+            network_health = "Single Node Mode"
+        elif active_peers < self.peer_network_manager.target_outbound_connections:
+            network_health = "Seeking More Peers"
+        else:
+            network_health = "Well Connected"
+
+        # Determine node role (simplified)
+        node_role = "Peer Node"
+
+        # Get mining difficulty status
+        difficulty_status = "Hard" if self.blockchain.target_difficulty > 4 else "Moderate"
+
+        status_summary = f"""
++======================================================================+
+|                    CHAINCORE NODE STATUS                            |
++======================================================================+
+| Node: {self.node_id:<20} Port: {self.api_port:<20}              |
+| Status: ONLINE & OPERATIONAL      Uptime: {uptime_readable:<15}   |
+| Chain: {blockchain_length:,} blocks{' + ' + str(pending_txs) + ' pending' if pending_txs > 0 else '':20}   |
+| Peers: {active_peers} connected ({total_peers} known)                      |
+| Difficulty: {self.blockchain.target_difficulty} {difficulty_status:<30}   |
++======================================================================+
+        """.strip()
+
+        return {
+            'STATUS_DISPLAY': status_summary,
+            'node_id': self.node_id,
+            'blockchain_length': blockchain_length,
+            'pending_transactions': pending_txs,
+            'peers': active_peers,
+            'total_peers': total_peers,
+            'node_role': node_role,
+            'target_difficulty': self.blockchain.target_difficulty,
+            'network_health': network_health,
+            'uptime': uptime_seconds,
+            'version': '2.0', # Updated version
+            'thread_safe': True,  # Mining client expects this field
+            'status': 'online',
+            'node_info': {
+                'thread_safe': True,
+                'initialized': blockchain_length > 0,
+                'operational': True
+            }
+        }
+    
     
     def _check_port_available(self, port: int) -> bool:
         """Check if a port is available for binding"""
@@ -5,21 +5,51 @@ Comprehensive tracking and analysis with JSON output for storage and review
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
 import json
 import time
 import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# Optional C-accelerated JSON encoder for the analysis export
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# previous_hash expected on the genesis block
+GENESIS_PREVIOUS_HASH = "0" * 64
+
+@functools.lru_cache(maxsize=1024)
+def _minute_prefix(minute: int) -> str:
+    """'YYYY-MM-DD HH:MM:' for a Unix minute, formatted once per minute"""
+    return time.strftime("%Y-%m-%d %H:%M:", time.localtime(minute * 60))
+
+def _format_block_time(timestamp: float) -> str:
+    """Block timestamp as 'YYYY-MM-DD HH:MM:SS' without building a datetime per block"""
+    # Round to microseconds first, as datetime.fromtimestamp does, then drop the fraction
+    minute, second = divmod(int(round(timestamp, 6)), 60)
+    return f"{_minute_prefix(minute)}{second:02d}"
 
 class BlockchainTracker:
     def __init__(self, node_url: str = "http://localhost:5000"):
         self.node_url = node_url
         self.analysis_data = {}
         
+        # One keep-alive connection shared by the /blockchain and /status fetches
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16,
+                                                  max_retries=Retry(total=2, backoff_factor=0.1)))
+        
     def get_blockchain_data(self) -> Optional[Dict]:
         """Get current blockchain data from node"""
         try:
-            response = requests.get(f"{self.node_url}/blockchain", timeout=5)
+            response = self.session.get(f"{self.node_url}/blockchain", timeout=5)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -32,7 +62,7 @@ class BlockchainTracker:
     def get_node_status(self) -> Optional[Dict]:
         """Get node status information"""
         try:
-            response = requests.get(f"{self.node_url}/status", timeout=5)
+            response = self.session.get(f"{self.node_url}/status", timeout=5)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -42,20 +72,17 @@ class BlockchainTracker:
     
     def extract_miner_from_block(self, block: Dict) -> str:
         """Extract miner address from block's coinbase transaction"""
-        try:
-            coinbase_tx = block['transactions'][0]
-            if coinbase_tx['outputs']:
-                return coinbase_tx['outputs'][0]['recipient_address']
-            return "unknown"
-        except (KeyError, IndexError):
-            return "unknown"
+        return self._coinbase_output(block)[0]
     
-    def analyze_block_details(self, block: Dict, previous_block: Optional[Dict] = None) -> Dict:
-        """Analyze detailed block information"""
-        miner = self.extract_miner_from_block(block)
+    def analyze_block_details(self, block: Dict, previous_block: Optional[Dict] = None,
+                              required_zeros: Optional[str] = None) -> Dict:
+        """Analyze detailed block information; callers walking a chain pass the shared difficulty prefix"""
+        # Miner and mining reward from the coinbase output, read together
+        miner, mining_reward = self._coinbase_output(block)
         
         # Hash validation
-        required_zeros = "0" * block['target_difficulty']
+        if required_zeros is None:
+            required_zeros = "0" * block['target_difficulty']
         hash_meets_difficulty = block['hash'].startswith(required_zeros)
         
         # Previous hash validation
@@ -63,20 +90,14 @@ class BlockchainTracker:
             prev_hash_correct = block['previous_hash'] == previous_block['hash']
         else:
             # Genesis block
-            prev_hash_correct = block['previous_hash'] == "0" * 64
+            prev_hash_correct = block['previous_hash'] == GENESIS_PREVIOUS_HASH
         
         # Index validation
         expected_index = previous_block['index'] + 1 if previous_block else 0
         index_correct = block['index'] == expected_index
         
-        # Mining reward calculation
-        mining_reward = 0.0
         transaction_fees = 0.0
         try:
-            coinbase_tx = block['transactions'][0]
-            if coinbase_tx['outputs']:
-                mining_reward = coinbase_tx['outputs'][0]['amount']
-            
             # Calculate fees from non-coinbase transactions
             for tx in block['transactions'][1:]:
                 # This is a simplified fee calculation
@@ -93,7 +114,7 @@ class BlockchainTracker:
             "previous_hash": block['previous_hash'],
             "miner_address": miner,
             "timestamp": block['timestamp'],
-            "human_time": datetime.fromtimestamp(block['timestamp']).strftime("%Y-%m-%d %H:%M:%S"),
+            "human_time": _format_block_time(block['timestamp']),
             "target_difficulty": block['target_difficulty'],
             "nonce": block['nonce'],
             "transaction_count": len(block['transactions']),
@@ -109,44 +130,49 @@ class BlockchainTracker:
             }
         }
     
-    def analyze_mining_distribution(self, blocks: List[Dict]) -> Dict:
-        """Analyze mining distribution across all miners"""
-        miner_stats = {}
+    def _coinbase_output(self, block: Dict) -> Tuple[str, float]:
+        """Miner address and reward from the block's first coinbase output, read together"""
+        try:
+            first_output = block['transactions'][0]['outputs'][0]
+        except (KeyError, IndexError):
+            return "unknown", 0.0
+        return first_output.get('recipient_address', "unknown"), first_output.get('amount', 0.0)
+    
+    def _tally_miner(self, miner_stats: Dict, miner: str, index: int, reward: float):
+        """Fold one block into its miner's running stats"""
+        stats = miner_stats.get(miner)
+        if stats is None:
+            stats = miner_stats[miner] = {
+                "blocks_mined": 0,
+                "block_indices": [],
+                "total_rewards": 0.0,
+                "first_block_index": index,
+                "last_block_index": index,
+                "average_difficulty": 0.0
+            }
         
-        for block in blocks:
-            miner = self.extract_miner_from_block(block)
-            
-            if miner not in miner_stats:
-                miner_stats[miner] = {
-                    "blocks_mined": 0,
-                    "block_indices": [],
-                    "total_rewards": 0.0,
-                    "first_block_index": block['index'],
-                    "last_block_index": block['index'],
-                    "average_difficulty": 0.0
-                }
-            
-            stats = miner_stats[miner]
-            stats['blocks_mined'] += 1
-            stats['block_indices'].append(block['index'])
-            stats['last_block_index'] = block['index']
-            
-            # Calculate rewards
-            try:
-                coinbase_tx = block['transactions'][0]
-                if coinbase_tx['outputs']:
-                    stats['total_rewards'] += coinbase_tx['outputs'][0]['amount']
-            except (KeyError, IndexError):
-                pass
-        
-        # Calculate percentages and averages
-        total_blocks = len(blocks)
+        stats['blocks_mined'] += 1
+        stats['block_indices'].append(index)
+        stats['last_block_index'] = index
+        stats['total_rewards'] += reward
+    
+    def _finish_miner_stats(self, miner_stats: Dict, total_blocks: int) -> Dict:
+        """Calculate percentages and averages once every block is tallied"""
         for miner, stats in miner_stats.items():
             stats['percentage'] = (stats['blocks_mined'] / total_blocks * 100) if total_blocks > 0 else 0
             stats['average_reward_per_block'] = stats['total_rewards'] / stats['blocks_mined'] if stats['blocks_mined'] > 0 else 0
         
         return miner_stats
     
+    def analyze_mining_distribution(self, blocks: List[Dict]) -> Dict:
+        """Analyze mining distribution across all miners"""
+        miner_stats = {}
+        for block in blocks:
+            miner, reward = self._coinbase_output(block)
+            self._tally_miner(miner_stats, miner, block['index'], reward)
+        
+        return self._finish_miner_stats(miner_stats, len(blocks))
+    
     def verify_hash_chain_integrity(self, blocks: List[Dict]) -> Dict:
         """Comprehensive hash chain integrity verification"""
         integrity_report = {
@@ -157,12 +183,25 @@ class BlockchainTracker:
             "overall_status": "unknown"
         }
         
+        # Column projections checked with whole-list compares in C; the per-block loop
+        # below only runs when some block actually fails
+        hashes = [block['hash'] for block in blocks]
+        links_ok = [block['previous_hash'] for block in blocks] == [GENESIS_PREVIOUS_HASH] + hashes[:-1]
+        indices_ok = [block['index'] for block in blocks] == list(range(len(blocks)))
+        zero_prefixes = {difficulty: "0" * difficulty for difficulty in {block['target_difficulty'] for block in blocks}}
+        if links_ok and indices_ok and all(
+                block_hash.startswith(zero_prefixes[block['target_difficulty']])
+                for block_hash, block in zip(hashes, blocks)):
+            integrity_report['valid_blocks'] = len(blocks)
+            integrity_report['overall_status'] = "perfect"
+            return integrity_report
+        
         for i, block in enumerate(blocks):
             block_valid = True
             block_issues = []
             
             # Check hash difficulty
-            required_zeros = "0" * block['target_difficulty']
+            required_zeros = zero_prefixes[block['target_difficulty']]
             if not block['hash'].startswith(required_zeros):
                 block_valid = False
                 block_issues.append({
@@ -175,12 +214,12 @@ class BlockchainTracker:
             # Check previous hash linkage
             if i == 0:
                 # Genesis block
-                if block['previous_hash'] != "0" * 64:
+                if block['previous_hash'] != GENESIS_PREVIOUS_HASH:
                     block_valid = False
                     block_issues.append({
                         "type": "invalid_genesis_prev_hash",
                         "description": "Genesis block should have previous_hash of all zeros",
-                        "expected": "0" * 64,
+                        "expected": GENESIS_PREVIOUS_HASH,
                         "actual": block['previous_hash']
                     })
             else:
@@ -226,36 +265,58 @@ class BlockchainTracker:
         
         return integrity_report
     
+    def _walk_blocks(self, blocks: List[Dict]) -> Tuple[List[Dict], Dict, Dict]:
+        """Per-block details, mining distribution and integrity from a single pass over the chain"""
+        zero_prefixes = {difficulty: "0" * difficulty for difficulty in {block['target_difficulty'] for block in blocks}}
+        detailed_blocks = []
+        miner_stats = {}
+        chain_valid = True
+        
+        for i, (previous_block, block) in enumerate(zip([None] + blocks, blocks)):
+            details = self.analyze_block_details(block, previous_block, zero_prefixes[block['target_difficulty']])
+            detailed_blocks.append(details)
+            self._tally_miner(miner_stats, details['miner_address'], details['block_index'], details['mining_reward'])
+            
+            # Same checks verify_hash_chain_integrity makes, read off the row just built
+            validation = details['validation']
+            chain_valid = (chain_valid and validation['hash_meets_difficulty']
+                           and validation['previous_hash_correct'] and block['index'] == i)
+        
+        if chain_valid:
+            integrity_report = {
+                "total_blocks": len(blocks),
+                "valid_blocks": len(blocks),
+                "invalid_blocks": 0,
+                "issues": [],
+                "overall_status": "perfect"
+            }
+        else:
+            # Only a broken chain pays for the detailed per-issue report
+            integrity_report = self.verify_hash_chain_integrity(blocks)
+        
+        return detailed_blocks, self._finish_miner_stats(miner_stats, len(blocks)), integrity_report
+    
     def full_blockchain_analysis(self) -> Dict:
         """Perform comprehensive blockchain analysis"""
         print("🔍 Performing comprehensive blockchain analysis...")
         
-        # Get blockchain data
-        blockchain_data = self.get_blockchain_data()
+        # Get blockchain data and node status - independent requests, issued concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            blockchain_future = executor.submit(self.get_blockchain_data)
+            status_future = executor.submit(self.get_node_status)
+            blockchain_data, node_status = blockchain_future.result(), status_future.result()
+        
         if not blockchain_data:
             return {"error": "Could not retrieve blockchain data"}
         
-        # Get node status
-        node_status = self.get_node_status()
-        
         blocks = blockchain_data['chain']
         
         print(f"📊 Analyzing {len(blocks)} blocks...")
-        
-        # Analyze each block in detail
-        detailed_blocks = []
-        for i, block in enumerate(blocks):
-            previous_block = blocks[i-1] if i > 0 else None
-            block_analysis = self.analyze_block_details(block, previous_block)
-            detailed_blocks.append(block_analysis)
-        
         print("⛏️ Analyzing mining distribution...")
-        # Mining distribution analysis
-        mining_distribution = self.analyze_mining_distribution(blocks)
-        
         print("🔗 Verifying hash chain integrity...")
-        # Hash chain integrity verification
-        integrity_report = self.verify_hash_chain_integrity(blocks)
+        
+        # Block details, mining distribution and hash chain integrity in one walk
+        detailed_blocks, mining_distribution, integrity_report = self._walk_blocks(blocks)
         
         # Compile comprehensive analysis
         analysis = {
@@ -286,11 +347,8 @@ class BlockchainTracker:
             "mining_distribution": mining_distribution,
             "hash_chain_integrity": integrity_report,
             "statistics": {
-                "total_transactions": sum(len(block['transactions']) for block in blocks),
-                "total_mining_rewards": sum(
-                    self.analyze_block_details(block)['mining_reward'] 
-                    for block in blocks
-                ),
+                "total_transactions": sum(block['transaction_count'] for block in detailed_blocks),
+                "total_mining_rewards": sum(block['mining_reward'] for block in detailed_blocks),
                 "average_block_time": (
                     (blocks[-1]['timestamp'] - blocks[0]['timestamp']) / (len(blocks) - 1)
                     if len(blocks) > 1 else 0
@@ -317,8 +375,13 @@ class BlockchainTracker:
             filename = f"blockchain_analysis_{timestamp}.json"
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.analysis_data, f, indent=2, default=str)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(self.analysis_data, default=str,
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(self.analysis_data, f, indent=2, default=str)
             
             print(f"✅ Analysis saved to: {filename}")
             return filename
@@ -416,7 +479,7 @@ def main():
             
             if filename:
                 print(f"\n💾 Complete analysis saved to: {filename}")
-                print(f"📂 File size: {len(json.dumps(analysis, indent=2))} characters")
+                print(f"📂 File size: {os.path.getsize(filename)} bytes")
                 print(f"🔍 View with: cat {filename} | python3 -m json.tool")
         else:
             print(f"❌ Analysis failed: {analysis['error']}")
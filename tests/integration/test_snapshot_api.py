@@ -0,0 +1,205 @@
+"""
+Integration tests for the monitor-facing node API.
+
+Tests cover:
+- /snapshot status and chain payload
+- ?since= delta slicing on /blockchain and /snapshot
+- ETag / If-None-Match revalidation (304)
+- Monitor fallback for nodes without /snapshot or ?since (404 / 400)
+"""
+import pytest
+import sys
+import os
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from flask import Flask, abort, jsonify, request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.block import Block
+from src.core.bitcoin_transaction import Transaction
+from src.monitoring.blockchain_monitor import NetworkBlockchainMonitor
+
+
+def make_blocks(length):
+    """Linked Block objects; the routes under test serve them without re-validating"""
+    blocks = []
+    previous_hash = "0" * 64
+    for i in range(length):
+        coinbase = Transaction.create_coinbase_transaction("miner", 50.0, i)
+        block = Block(index=i, transactions=[coinbase], previous_hash=previous_hash,
+                      timestamp=1700000000 + i * 10, target_difficulty=1)
+        blocks.append(block)
+        previous_hash = block.hash
+    return blocks
+
+
+class FlaskAdapter(BaseAdapter):
+    """Route a requests.Session to a Flask app's test client instead of the network"""
+
+    def __init__(self, app):
+        super().__init__()
+        self.client = app.test_client()
+
+    def send(self, prepared, **kwargs):
+        url = urlsplit(prepared.url)
+        path = f"{url.path}?{url.query}" if url.query else url.path
+        result = self.client.open(path, method=prepared.method, headers=dict(prepared.headers))
+
+        response = requests.Response()
+        response.status_code = result.status_code
+        response._content = result.data
+        response.headers = CaseInsensitiveDict(result.headers)
+        response.url = prepared.url
+        response.request = prepared
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def node():
+    """Network node serving a 5-block in-memory chain (needs the node's database driver)"""
+    pytest.importorskip("psycopg2")
+    from src.nodes.network_node import ThreadSafeNetworkNode
+
+    try:
+        node = ThreadSafeNetworkNode("core_test", 5990, 8990)
+    except Exception as e:
+        pytest.skip(f"Network node could not start: {e}")
+    node.blockchain._chain = make_blocks(5)
+    return node
+
+
+@pytest.fixture
+def client(node):
+    return node.app.test_client()
+
+
+@pytest.fixture
+def old_node_app():
+    """A node predating /snapshot whose /blockchain rejects ?since with 400"""
+    app = Flask(__name__)
+    chain = [block.to_dict() for block in make_blocks(5)]
+
+    @app.route('/status')
+    def status():
+        return jsonify({'node_id': 'core_old', 'blockchain_length': len(chain), 'uptime': 12.5})
+
+    @app.route('/blockchain')
+    def blockchain():
+        if 'since' in request.args:
+            abort(400)
+        return jsonify({'length': len(chain), 'chain': chain})
+
+    app.chain = chain
+    return app
+
+
+@pytest.fixture
+def monitor():
+    monitor = NetworkBlockchainMonitor(5000, 5001)
+    yield monitor
+    monitor.close()
+
+
+class TestSnapshotEndpoint:
+    """Test the combined blockchain + status endpoint"""
+
+    def test_status_matches_status_endpoint(self, client):
+        """The embedded status carries the same fields as /status"""
+        snapshot = client.get('/snapshot').get_json()
+        status = client.get('/status').get_json()
+
+        assert set(snapshot['status']) == set(status)
+        assert snapshot['status']['blockchain_length'] == 5
+        assert snapshot['status']['uptime'] > 0
+
+    def test_full_chain_by_default(self, client, node):
+        """Without ?since the whole chain is returned"""
+        blockchain = client.get('/snapshot').get_json()['blockchain']
+
+        assert blockchain['length'] == 5
+        assert [block['hash'] for block in blockchain['chain']] == [block.hash for block in node.blockchain._chain]
+
+    def test_since_returns_tail(self, client):
+        """?since=3 returns blocks 3 and 4 while length stays the full chain length"""
+        blockchain = client.get('/snapshot?since=3').get_json()['blockchain']
+
+        assert blockchain['length'] == 5
+        assert [block['index'] for block in blockchain['chain']] == [3, 4]
+
+
+class TestBlockchainDelta:
+    """Test ?since= slicing on /blockchain"""
+
+    def test_since_slices_chain(self, client):
+        """Only blocks from the requested index on are serialized"""
+        data = client.get('/blockchain?since=2').get_json()
+
+        assert data['length'] == 5
+        assert data['since'] == 2
+        assert [block['index'] for block in data['chain']] == [2, 3, 4]
+
+    def test_since_past_tip_is_empty(self, client):
+        """A caller that is already current gets an empty chain"""
+        assert client.get('/blockchain?since=5').get_json()['chain'] == []
+
+
+class TestConditionalGet:
+    """Test ETag revalidation on /blockchain and /snapshot"""
+
+    @pytest.mark.parametrize("path", ['/blockchain', '/snapshot', '/blockchain?since=2'])
+    def test_unchanged_chain_is_not_modified(self, client, path):
+        """Revalidating with the returned ETag answers 304 with no body"""
+        first = client.get(path)
+        second = client.get(path, headers={'If-None-Match': first.headers['ETag']})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.data == b''
+
+    def test_new_block_changes_etag(self, client, node):
+        """Once the chain grows the old ETag no longer matches"""
+        etag = client.get('/snapshot').headers['ETag']
+        node.blockchain._chain = make_blocks(6)
+
+        response = client.get('/snapshot', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.get_json()['blockchain']['length'] == 6
+
+    def test_monitor_revalidates(self, monitor, node):
+        """The monitor's cached payload is reused when the node answers 304"""
+        monitor.session.mount('http://', FlaskAdapter(node.app))
+        monitor.cache_ttl['blockchain'] = 0
+
+        first = monitor.get_peer_blockchain_data("http://node")
+        second = monitor.get_peer_blockchain_data("http://node")
+
+        assert second is first
+
+
+class TestOldNodeFallback:
+    """Test monitor fallback against nodes without /snapshot or ?since"""
+
+    def test_missing_snapshot_falls_back(self, monitor, old_node_app):
+        """A 404 on /snapshot marks the peer and fetches /blockchain and /status instead"""
+        monitor.session.mount('http://', FlaskAdapter(old_node_app))
+
+        blockchain_data, status = monitor.fetch_peer_data("http://old")
+
+        assert monitor._supports_snapshot["http://old"] is False
+        assert blockchain_data['chain'] == old_node_app.chain
+        assert status['uptime'] == 12.5
+
+    def test_rejected_since_is_sliced_locally(self, monitor, old_node_app):
+        """A 400 on ?since is retried as one full fetch, sliced client-side"""
+        monitor.session.mount('http://', FlaskAdapter(old_node_app))
+
+        blockchain_data, _ = monitor.fetch_peer_data("http://old", since=3)
+
+        assert blockchain_data['chain'] == old_node_app.chain[3:]
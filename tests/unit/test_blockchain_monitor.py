@@ -0,0 +1,499 @@
+"""
+Unit tests for the network blockchain monitor.
+Tests hash chain verification and mining distribution analysis on plain block dicts.
+"""
+import pytest
+import sys
+import os
+import socket
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.monitoring.blockchain_monitor import NetworkBlockchainMonitor, _probe_open_ports, _to_soa
+
+
+def make_chain(length, miner="miner_addr", node="core0", difficulty=2):
+    """Build a valid chain of block dicts as served by /blockchain"""
+    chain = []
+    previous_hash = "0" * 64
+    for i in range(length):
+        block_hash = "0" * difficulty + f"{i:x}".rjust(64 - difficulty, "a")
+        chain.append({
+            'index': i,
+            'hash': block_hash,
+            'previous_hash': previous_hash,
+            'timestamp': 1700000000 + i * 10,
+            'nonce': i,
+            'target_difficulty': difficulty,
+            'transactions': [{'outputs': [{'recipient_address': miner, 'amount': 50.0}]}],
+            'mining_metadata': {'mining_node': node}
+        })
+        previous_hash = block_hash
+    return chain
+
+
+@pytest.fixture
+def monitor():
+    """Monitor instance that never touches the network"""
+    monitor = NetworkBlockchainMonitor(5000, 5001)
+    yield monitor
+    monitor.close()
+
+
+class TestHashChainVerification:
+    """Test full and incremental hash chain verification"""
+
+    def test_valid_chain_has_no_issues(self, monitor):
+        """A well-formed chain reports no issues"""
+        assert monitor.verify_hash_chain(make_chain(10)) == []
+
+    def test_broken_link_detected(self, monitor):
+        """A wrong previous_hash is reported as a hash mismatch"""
+        chain = make_chain(5)
+        chain[3]['previous_hash'] = "f" * 64
+
+        issues = monitor.verify_hash_chain(chain)
+
+        assert [issue['type'] for issue in issues] == ['hash_mismatch']
+        assert issues[0]['block_index'] == 3
+
+    def test_index_gap_and_difficulty_detected(self, monitor):
+        """Index gaps and hashes missing the difficulty prefix are reported"""
+        chain = make_chain(4)
+        chain[2]['index'] = 7
+        chain[3]['index'] = 8
+        chain[3]['hash'] = "f" + chain[3]['hash'][1:]
+
+        types = sorted(issue['type'] for issue in monitor.verify_hash_chain(chain))
+
+        assert types == ['index_gap', 'invalid_difficulty']
+
+    def test_incremental_only_checks_new_blocks(self, monitor):
+        """Blocks verified on a previous call are not reported again"""
+        chain = make_chain(6)
+        chain[2]['previous_hash'] = "f" * 64
+
+        assert len(monitor.verify_hash_chain_incremental(chain)) == 1
+
+        chain.extend(make_chain(8)[6:])
+
+        assert monitor.verify_hash_chain_incremental(chain) == []
+        assert monitor.last_verified_index == 7
+
+    def test_incremental_resets_on_reorg(self, monitor):
+        """A replaced tip causes the whole chain to be re-verified"""
+        chain = make_chain(5)
+        monitor.verify_hash_chain_incremental(chain)
+
+        forked = make_chain(5, difficulty=3)
+        forked[1]['previous_hash'] = "f" * 64
+
+        issues = monitor.verify_hash_chain_incremental(forked)
+
+        assert [issue['block_index'] for issue in issues] == [1]
+
+
+class TestFastChainValidation:
+    """Test the early-exit, cached verify_hash_chain(fast=True) used for consensus"""
+
+    def test_valid_and_broken_chains(self, monitor):
+        """Linked chains pass and a broken link is reported alone"""
+        chain = make_chain(6)
+        assert monitor.verify_hash_chain(chain, fast=True) == []
+
+        broken = make_chain(6, difficulty=3)
+        broken[2]['previous_hash'] = "f" * 64
+        broken[4]['previous_hash'] = "f" * 64
+        issues = monitor.verify_hash_chain(broken, fast=True)
+        assert [issue['block_index'] for issue in issues] == [2]
+
+    def test_corrupted_link_is_detected_after_verify(self, monitor):
+        """A block re-sent with a known hash but a different previous_hash is still rejected"""
+        chain = make_chain(6)
+        assert monitor.verify_hash_chain(chain[:4], fast=True) == []
+
+        chain[2] = dict(chain[2], previous_hash="f" * 64)
+        issues = monitor.verify_hash_chain(chain, fast=True)
+        assert [(issue['type'], issue['block_index']) for issue in issues] == [('hash_mismatch', 2)]
+
+    def test_stored_columns_are_checked(self, monitor):
+        """Columns passed in are verified the same way as the chain they project"""
+        chain = make_chain(6)
+        chain[4] = dict(chain[4], previous_hash="f" * 64)
+
+        issues = monitor.verify_hash_chain(chain, fast=True, columns=_to_soa(chain))
+        assert [issue['block_index'] for issue in issues] == [4]
+
+
+class TestMiningDistribution:
+    """Test mining distribution aggregation"""
+
+    def test_distribution_counts_blocks_and_rewards(self, monitor):
+        """Blocks and rewards are attributed to the mining core"""
+        stats = monitor.analyze_mining_distribution(make_chain(3, node="core1"))
+
+        assert list(stats) == ['Core-core1']
+        assert stats['Core-core1']['blocks_mined'] == 3
+        assert stats['Core-core1']['total_rewards'] == 150.0
+        assert stats['Core-core1']['block_indices'] == [0, 1, 2]
+
+    def test_incremental_update_matches_full_analysis(self, monitor):
+        """Folding blocks in batches gives the same result as one full pass"""
+        chain = make_chain(4, node="core1") + make_chain(7, node="core2")[4:]
+
+        monitor.update_mining_distribution(chain[:4])
+        monitor.update_mining_distribution(chain[4:])
+
+        assert monitor.miner_stats == monitor.analyze_mining_distribution(chain)
+
+    def test_distribution_reuses_cached_prefix(self, monitor):
+        """Extending a cached chain only aggregates the new blocks"""
+        chain = make_chain(6, node="core1")
+        monitor.analyze_mining_distribution(chain[:4])
+
+        seen = []
+        original = monitor._block_metadata
+        monitor._block_metadata = lambda block: seen.append(block['index']) or original(block)
+
+        stats = monitor.analyze_mining_distribution(chain)
+
+        assert seen == [4, 5]
+        assert stats['Core-core1']['block_indices'] == [0, 1, 2, 3, 4, 5]
+        assert monitor.analyze_mining_distribution(chain) == stats
+        assert monitor.analyze_mining_distribution(chain[:4])['Core-core1']['blocks_mined'] == 4
+
+    def test_cached_result_is_not_shared(self, monitor):
+        """Mutating a returned distribution does not change later results"""
+        chain = make_chain(3, node="core1")
+        stats = monitor.analyze_mining_distribution(chain)
+        stats['Core-core1']['blocks_mined'] = 99
+        stats['Core-core1']['block_indices'].append(99)
+
+        again = monitor.analyze_mining_distribution(chain)
+        assert again['Core-core1']['blocks_mined'] == 3
+        assert again['Core-core1']['block_indices'] == [0, 1, 2]
+
+    def test_cache_is_cleared_with_all_data(self, monitor):
+        """_clear_all_data also drops memoized distributions"""
+        monitor.analyze_mining_distribution(make_chain(3))
+        monitor._clear_all_data()
+
+        assert not monitor._mining_cache
+
+
+class TestMinerExtraction:
+    """Test miner attribution extraction from block dicts"""
+
+    def test_metadata_attribution(self, monitor):
+        """mining_metadata takes priority over the source peer"""
+        block = make_chain(1, miner="addr1", node="core7")[0]
+
+        assert monitor.extract_miner_from_block(block, "http://localhost:5001") == ("addr1", "core7")
+
+    def test_source_peer_fallback(self, monitor):
+        """Blocks without attribution fall back to the peer they came from"""
+        block = make_chain(1, miner="addr1")[0]
+        del block['mining_metadata']
+
+        assert monitor.extract_miner_from_block(block) == ("addr1", "unknown")
+        assert monitor.extract_miner_from_block(block, "http://localhost:5001") == ("addr1", "Node-5001")
+
+    def test_malformed_block(self, monitor):
+        """Blocks without a coinbase output report an unknown miner"""
+        block = {'index': 3, 'transactions': []}
+
+        assert monitor.extract_miner_from_block(block) == ("unknown", "unknown")
+
+
+class TestAdaptivePollInterval:
+    """Test poll interval derived from block timestamps"""
+
+    def test_default_without_history(self, monitor):
+        """The configured interval is used until two blocks have arrived"""
+        assert monitor._next_poll_interval(5) == 5
+        monitor._record_block_arrival(make_chain(1))
+        assert monitor._next_poll_interval(5) == 5
+
+    def test_half_of_mean_block_time(self, monitor):
+        """Polls twice per block interval, read from the blocks' own timestamps"""
+        monitor._record_block_arrival(make_chain(4))
+        block_time = make_chain(2)[1]['timestamp'] - make_chain(2)[0]['timestamp']
+
+        assert monitor._next_poll_interval(30) == block_time / 2
+
+    def test_one_entry_per_block(self, monitor):
+        """Blocks seen in one poll each count, so the estimate does not follow the poll rate"""
+        monitor._record_block_arrival([{'timestamp': 100.0}, {'timestamp': 104.0}, {'timestamp': 108.0}])
+
+        assert monitor._next_poll_interval(30) == 2.0
+
+    def test_interval_is_clamped(self, monitor):
+        """Fast chains poll no faster than 1s; slow chains never exceed the user's interval"""
+        monitor._block_arrival_times.extend([100.0, 100.5, 101.0])
+        assert monitor._next_poll_interval(5) == 1.0
+
+        monitor._block_arrival_times.clear()
+        monitor._block_arrival_times.extend([0.0, 600.0])
+        assert monitor._next_poll_interval(5) == 5
+
+
+class TestSnapshotFetch:
+    """Test single-request /snapshot fetching with fallback for older nodes"""
+
+    def test_snapshot_splits_chain_and_status(self, monitor, monkeypatch):
+        """A /snapshot payload yields both blockchain data and status"""
+        chain = make_chain(3)
+        payload = {'status': {'blockchain_length': 3}, 'blockchain': {'length': 3, 'chain': chain}}
+        monkeypatch.setattr(monitor, '_get_json_cached', lambda url, ttl, timeout: payload)
+
+        blockchain_data, status = monitor.fetch_peer_data("http://localhost:5001")
+
+        assert blockchain_data['chain'] == chain
+        assert status['blockchain_length'] == 3
+        assert monitor._supports_snapshot["http://localhost:5001"] is True
+
+    def test_missing_endpoint_is_remembered(self, monitor, monkeypatch):
+        """A 404 on /snapshot marks the peer so it is not probed again"""
+        requested = []
+
+        def fake_get(url, ttl, timeout):
+            requested.append(url)
+            if url.endswith('/snapshot'):
+                monitor._not_found.add(url)
+                return None
+            return {'chain': []} if '/blockchain' in url else {'blockchain_length': 0}
+
+        monkeypatch.setattr(monitor, '_get_json_cached', fake_get)
+
+        monitor.fetch_peer_data("http://localhost:5001")
+        monitor.fetch_peer_data("http://localhost:5001")
+
+        assert [url for url in requested if url.endswith('/snapshot')] == ["http://localhost:5001/snapshot"]
+        assert monitor._supports_snapshot["http://localhost:5001"] is False
+
+    def test_unreachable_peer_is_not_retried(self, monitor, monkeypatch):
+        """A transport failure on /snapshot does not fall back to /blockchain and /status"""
+        requested = []
+
+        def fake_get(url, ttl, timeout):
+            requested.append(url)
+            return None
+
+        monkeypatch.setattr(monitor, '_get_json_cached', fake_get)
+
+        assert monitor.fetch_peer_data("http://localhost:5001") == (None, None)
+        assert requested == ["http://localhost:5001/snapshot"]
+        assert "http://localhost:5001" not in monitor._supports_snapshot
+
+
+class TestDeltaChainMerge:
+    """Test splicing ?since deltas onto the chain held per peer"""
+
+    def test_delta_extends_held_chain(self, monitor):
+        """A delta starting at the held tip is appended"""
+        chain = make_chain(8)
+        monitor._merge_peer_chain("peer", {'chain': chain[:5]}, 0)
+
+        since = monitor._delta_start("peer")
+        merged = monitor._merge_peer_chain("peer", {'chain': chain[since:]}, since)
+
+        assert since == 4
+        assert merged == chain
+
+    def test_mismatched_overlap_is_rejected(self, monitor):
+        """A delta whose first block differs from the held one signals a reorg"""
+        monitor._merge_peer_chain("peer", {'chain': make_chain(5)}, 0)
+        forked = make_chain(6, difficulty=3)
+
+        assert monitor._merge_peer_chain("peer", {'chain': forked[4:]}, 4) is None
+        assert monitor._merge_peer_chain("peer", {'chain': []}, 4) is None
+
+
+class TestBlockConsensus:
+    """Test per-block consensus lookup across peer chains"""
+
+    def test_counts_peers_holding_block(self, monitor):
+        """Only peers with the same (index, hash) count towards consensus"""
+        chain = make_chain(4)
+        peer_chains = {
+            "http://localhost:5001": {'chain': chain},
+            "http://localhost:5002": {'chain': chain[:3]},
+            "http://localhost:5003": {'chain': make_chain(4, difficulty=3)},
+        }
+
+        result = monitor._check_block_consensus(chain[2], peer_chains)
+
+        assert result['consensus_count'] == 2
+        assert result['first_appearance'] == "Node-5001"
+        assert result['is_consensus'] is True
+        assert monitor._check_block_consensus(chain[3], peer_chains)['consensus_count'] == 1
+
+    def test_summary_reports_equal_length_forks(self, monitor, capsys):
+        """Peers with the same length but different tips are reported as forks"""
+        monitor.peer_data = {'blockchains': {
+            "http://localhost:5001": {'chain': make_chain(3)},
+            "http://localhost:5002": {'chain': make_chain(3, difficulty=3)},
+        }}
+
+        monitor.display_network_consensus_summary({'peer_count': 2, 'consensus_peers': 1})
+
+        assert "Competing forks at equal length" in capsys.readouterr().out
+
+    def test_unknown_block(self, monitor):
+        """A block no peer holds has no consensus"""
+        result = monitor._check_block_consensus({'index': 9, 'hash': 'x'}, {"http://localhost:5001": {'chain': make_chain(2)}})
+
+        assert result['consensus_count'] == 0
+        assert result['first_appearance'] == "unknown"
+
+    def test_metadata_cached_by_hash(self, monitor):
+        """Attribution and reward are read once per block hash"""
+        block = make_chain(1, miner="addr1", node="core7")[0]
+
+        assert monitor._block_metadata(block) == ("addr1", "core7", 50.0)
+
+        block['mining_metadata'] = {'mining_node': 'other'}
+        assert monitor.extract_miner_from_block(block) == ("addr1", "core7")
+
+
+class TestAggregationTips:
+    """Test that unchanged peer tips skip consensus re-validation"""
+
+    def test_unchanged_tips_reuse_consensus(self, monitor, monkeypatch):
+        """A tick where no peer's (length, tip) moved reuses the last consensus"""
+        chain = make_chain(5)
+        monitor.active_peers = {"http://localhost:5001"}
+        monkeypatch.setattr(monitor, 'fetch_peer_data',
+                            lambda peer_url, since=0: ({'chain': chain[since:]}, {'blockchain_length': len(chain)}))
+
+        first = monitor.aggregate_network_data()['consensus_ledger']
+        monkeypatch.setattr(monitor, 'get_consensus_ledger', lambda peer_chains: pytest.fail("re-validated"))
+        second = monitor.aggregate_network_data()['consensus_ledger']
+
+        assert second is first
+        assert len(second['consensus_chain']) == 5
+
+    def test_synced_peers_share_one_chain(self, monitor, monkeypatch):
+        """Peers with the same (length, tip) hold one shared chain list"""
+        chain = make_chain(4)
+        monitor.active_peers = {"http://localhost:5001", "http://localhost:5002"}
+        monkeypatch.setattr(monitor, 'fetch_peer_data',
+                            lambda peer_url, since=0: ({'chain': list(chain[since:])}, {'blockchain_length': 4}))
+
+        peer_chains = monitor.aggregate_network_data()['peer_chains']
+
+        assert peer_chains["http://localhost:5001"]['chain'] is peer_chains["http://localhost:5002"]['chain']
+        assert monitor._check_block_consensus(chain[2], peer_chains)['consensus_count'] == 2
+
+    def test_departed_peer_state_is_pruned(self, monitor):
+        """State for peers that left, and cache entries past their grace, is dropped"""
+        monitor._merge_peer_chain("http://localhost:5002", {'chain': make_chain(3)}, 0)
+        monitor._supports_snapshot["http://localhost:5002"] = True
+        monitor.peer_last_seen.update({'unified_ledger': 3, 'peer_http://localhost:5002': 3})
+        monitor._response_cache["http://localhost:5002/status"] = (0.0, {})
+        monitor._etags["http://localhost:5002/status"] = '"x"'
+
+        monitor._prune_peer_state(["http://localhost:5001"])
+
+        assert monitor._peer_chains == {} and monitor._peer_soa == {}
+        assert monitor._supports_snapshot == {}
+        assert monitor.peer_last_seen == {'unified_ledger': 3}
+        assert monitor._response_cache == {} and monitor._etags == {}
+
+
+class TestPeerStatusAnalysis:
+    """Test reuse of per-peer status rows across polls"""
+
+    def test_unchanged_status_payload_keeps_row(self, monitor):
+        """Only peers with a new status payload get a new row"""
+        status_a = {'node_id': 'core1', 'blockchain_length': 3}
+        monitor.peer_data = {'statuses': {"http://localhost:5001": status_a,
+                                          "http://localhost:5002": {'node_id': 'core2'}}}
+        first = monitor.analyze_network_peer_status()
+
+        monitor.peer_data = {'statuses': {"http://localhost:5001": status_a,
+                                          "http://localhost:5002": {'node_id': 'core2', 'uptime': 5}}}
+        second = monitor.analyze_network_peer_status()
+
+        assert second["http://localhost:5001"] is first["http://localhost:5001"]
+        assert second["http://localhost:5002"]['uptime'] == 5
+
+
+class TestResponseCache:
+    """Test the bounded LRU response cache"""
+
+    def test_least_recently_used_entry_is_evicted(self, monitor):
+        """Past the entry cap the oldest unused URL and its ETag are dropped"""
+        monitor.response_cache_size = 2
+        monitor._store_response("a", 10, {'n': 1}, '"a"')
+        monitor._store_response("b", 10, {'n': 2})
+
+        # Touch "a" so "b" becomes the least recently used
+        assert monitor._get_json_cached("a", 10, timeout=1) == {'n': 1}
+        monitor._store_response("c", 10, {'n': 3})
+
+        assert list(monitor._response_cache) == ["a", "c"]
+        assert monitor._etags == {"a": '"a"'}
+
+
+class TestDeltaFetch:
+    """Test ?since delta fetching against nodes that do not support it"""
+
+    def test_rejected_since_falls_back_to_full_fetch(self, monitor, monkeypatch):
+        """A node that rejects ?since is fetched in full and sliced locally"""
+        chain = make_chain(6)
+
+        def fake_get(url, ttl, timeout):
+            if 'since=' in url:
+                monitor._not_found.add(url)
+                return None
+            return {'length': 6, 'chain': chain}
+
+        monkeypatch.setattr(monitor, '_get_json_cached', fake_get)
+
+        data = monitor.get_peer_blockchain_data("http://localhost:5001", since=4)
+
+        assert data['chain'] == chain[4:]
+
+    def test_headers_fall_back_to_full_chain(self, monitor, monkeypatch):
+        """Nodes without /blockchain/headers are compared on their full chain"""
+        chain = make_chain(3)
+
+        def fake_get(url, ttl, timeout):
+            if url.endswith('/headers'):
+                return None
+            return {'length': 3, 'chain': chain}
+
+        monkeypatch.setattr(monitor, '_get_json_cached', fake_get)
+
+        assert monitor.get_peer_headers("http://localhost:5001") == chain
+
+
+class TestPortProbe:
+    """Test the TCP pre-check used by peer discovery"""
+
+    def test_only_listening_ports_are_reported(self):
+        """A listening port is reported; a port nobody listens on is not"""
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        closed = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        closed.bind(("127.0.0.1", 0))
+        open_port = listener.getsockname()[1]
+        closed_port = closed.getsockname()[1]
+        try:
+            assert _probe_open_ports("127.0.0.1", [open_port, closed_port]) == [open_port]
+        finally:
+            listener.close()
+            closed.close()
+
+    def test_hostname_tries_every_address(self):
+        """A hostname probe finds a listener on any of its addresses, as the HTTP client would"""
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+        try:
+            assert _probe_open_ports("localhost", [port]) == [port]
+        finally:
+            listener.close()
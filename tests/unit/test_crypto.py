@@ -20,6 +20,7 @@ from src.crypto.ecdsa_crypto import (
     verify_signature, 
     hash_data, 
     double_sha256,
+    double_sha256_prefixed,
     validate_address
 )
 
@@ -197,6 +198,17 @@ class TestHashFunctions:
         assert hash_data(data_bytes) == hash_data(data_str)
         assert double_sha256(data_bytes) == double_sha256(data_str)
         
+    def test_double_sha256_prefixed_matches(self):
+        """Hashing from a shared prefix state should equal double SHA-256 of the whole message"""
+        header = json.dumps({'index': 1, 'nonce': "__NONCE__", 'previous_hash': "0" * 64}, sort_keys=True)
+        prefix, suffix = header.split('"__NONCE__"')
+        hash_nonce = double_sha256_prefixed(prefix)
+        
+        for nonce in (0, 7, 123456):
+            expected = double_sha256(json.dumps({'index': 1, 'nonce': nonce, 'previous_hash': "0" * 64}, sort_keys=True))
+            assert hash_nonce(f"{nonce}{suffix}") == expected
+            assert hash_nonce(f"{nonce}{suffix}".encode('utf-8')) == expected
+        
     def test_hash_avalanche_effect(self):
         """Small input change should dramatically change hash"""
         hash1 = hash_data("test1")